@@ -1,7 +1,8 @@
 """Cameron Code - Extended Claude Code wrapper for testing SDK capabilities."""
 
-from .client import CameronCodeClient
-from .tools import cameron_search, cameron_time
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .providers import (
     ProviderConfig,
     PROVIDERS,
@@ -14,7 +15,20 @@ from .providers import (
     get_current_provider_info,
 )
 
+if TYPE_CHECKING:
+    from .client import AuditEntry, CameronCodeClient
+    from .tools import cameron_search, cameron_time
+
+# Names that live in SDK-backed modules, imported on first access
+_LAZY_ATTRS = {
+    "AuditEntry": ".client",
+    "CameronCodeClient": ".client",
+    "cameron_search": ".tools",
+    "cameron_time": ".tools",
+}
+
 __all__ = [
+    "AuditEntry",
     "CameronCodeClient",
     "cameron_search",
     "cameron_time",
@@ -28,3 +42,13 @@ __all__ = [
     "get_provider_env_example",
     "get_current_provider_info",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Load client and tool exports lazily so provider helpers skip the SDK import."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,11 +1,21 @@
 """Cameron Code client - wraps Claude Agent SDK with custom capabilities."""
 
-from typing import AsyncIterator, Callable, Any
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import inspect
+import re
+from collections import deque
+from typing import AsyncIterator, Callable, Any, Iterator, TypeVar
 from claude_agent_sdk import (
     ClaudeSDKClient,
     ClaudeAgentOptions,
     create_sdk_mcp_server,
+    AssistantMessage,
     Message,
+    StreamEvent,
+    TextBlock,
     PermissionResult,
     PermissionResultAllow,
     PermissionResultDeny,
@@ -16,6 +26,127 @@ from claude_agent_sdk import (
 
 from .tools import cameron_search, cameron_time
 
+# Bash commands Cameron Code always refuses, matched in a single pass
+DANGEROUS_PATTERNS = ("rm -rf /", ":(){ :|:& };:", "mkfs", "> /dev/sda")
+_DANGEROUS_RE = re.compile("|".join(re.escape(p) for p in DANGEROUS_PATTERNS))
+
+# Read-only tools that skip straight to allow when no custom callback is set
+_FAST_PATH_TOOLS = frozenset(
+    {
+        "Read",
+        "Glob",
+        "Grep",
+        "mcp__cameron__cameron_search",
+        "mcp__cameron__cameron_time",
+    }
+)
+
+# Stateless allow result shared by every permission check
+_ALLOW = PermissionResultAllow()
+
+# Shared hook result; the SDK copies hook output before sending it to the CLI
+_HOOK_CONTINUE: dict = {"continue_": True}
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _requires_connection(method: _F) -> _F:
+    """Raise before running ``method`` if the client has no active session.
+
+    Coroutine methods get an ``async`` wrapper, so they stay coroutine functions
+    and the check runs when the coroutine is awaited, not when it is created.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: "CameronCodeClient", *args: Any, **kwargs: Any) -> Any:
+            if self._client is None:
+                raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+            return await method(self, *args, **kwargs)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self: "CameronCodeClient", *args: Any, **kwargs: Any) -> Any:
+        if self._client is None:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+        return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _is_text_delta(message: Message) -> bool:
+    """Whether a message is a partial text chunk from a streamed response."""
+    if not isinstance(message, StreamEvent):
+        return False
+    event = message.event
+    return event.get("type") == "content_block_delta" and (
+        event.get("delta", {}).get("type") == "text_delta"
+    )
+
+
+async def _dedupe_streamed_text(
+    messages: AsyncIterator[Message],
+) -> AsyncIterator[Message]:
+    """Drop text already delivered as stream deltas from the consolidated message.
+
+    Deltas are joined per content block, keyed by ``parent_tool_use_id`` so
+    subagent streams don't interleave. A TextBlock is removed only when its
+    text equals a block that was streamed, and each streamed block is used once.
+    """
+    streamed: dict[str | None, dict[int, list[str]]] = {}
+    async for message in messages:
+        if _is_text_delta(message):
+            blocks = streamed.setdefault(message.parent_tool_use_id, {})
+            blocks.setdefault(message.event.get("index", 0), []).append(
+                message.event["delta"].get("text", "")
+            )
+        elif isinstance(message, StreamEvent) and message.event.get("type") == "message_start":
+            # Block indexes restart with every API message
+            streamed.pop(message.parent_tool_use_id, None)
+        elif isinstance(message, AssistantMessage):
+            blocks = streamed.get(message.parent_tool_use_id)
+            if blocks:
+                pending = {index: "".join(parts) for index, parts in blocks.items()}
+                content = []
+                for block in message.content:
+                    if isinstance(block, TextBlock):
+                        index = next((i for i, t in pending.items() if t == block.text), None)
+                        if index is not None:
+                            del pending[index], blocks[index]
+                            continue
+                    content.append(block)
+                if len(content) != len(message.content):
+                    message = dataclasses.replace(message, content=content)
+        yield message
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class AuditEntry:
+    """A single audit log record for a permission check or tool hook."""
+
+    event: str
+    tool_name: str
+    tool_input: dict | None = None
+    tool_output: Any = None
+    tool_use_id: str | None = None
+
+    def to_dict(self) -> dict:
+        """Render the entry in the dict shape returned by ``get_audit_log``."""
+        if self.event == "permission_check":
+            return {"event": self.event, "tool": self.tool_name, "input": self.tool_input}
+        entry = {
+            "event": self.event,
+            "tool_use_id": self.tool_use_id,
+            "tool_name": self.tool_name,
+        }
+        if self.event == "pre_tool":
+            entry["tool_input"] = self.tool_input
+        else:
+            entry["tool_output"] = self.tool_output
+        return entry
+
 
 class CameronCodeClient:
     """Extended Claude Code client with custom tools, hooks, and permissions."""
@@ -28,18 +159,102 @@ class CameronCodeClient:
         pre_tool_hook: Callable[..., dict] | None = None,
         post_tool_hook: Callable[..., dict] | None = None,
         audit_log: list[dict] | None = None,
+        audit_log_capacity: int = 10_000,
+        audit_batch_size: int = 64,
+        audit_flush_interval: float = 0.05,
+        audit: bool = True,
         allowed_tools: list[str] | None = None,
         setting_sources: list[str] | None = None,
+        stream_partials: bool = True,
     ) -> None:
+        """Configure the client; the SDK session starts on ``async with``.
+
+        Args:
+            cwd: Working directory for the Claude Code session
+            permission_callback: Called for tools the built-in checks don't decide
+            pre_tool_hook: Extra PreToolUse hook run after auditing
+            post_tool_hook: Extra PostToolUse hook run after auditing
+            audit_log: List that receives audit entries as ``get_audit_log`` dicts,
+                appended on each batch flush; defaults to a bounded buffer
+            audit_log_capacity: Size of the default audit buffer
+            audit_batch_size: Most audit entries written per flush
+            audit_flush_interval: Seconds the flush task waits to gather a batch
+            audit: Record audit entries at all
+            allowed_tools: Tools the session may use without asking
+            setting_sources: Settings to load; defaults to ``["project"]``
+            stream_partials: Yield text as StreamEvent deltas. Text that arrived
+                as deltas is then removed from the consolidated AssistantMessage,
+                so read the deltas or pass ``stream_partials=False`` to get the
+                full text on AssistantMessage as before.
+        """
         self.cwd = cwd
         self.custom_permission_callback = permission_callback
         self.custom_pre_tool_hook = pre_tool_hook
         self.custom_post_tool_hook = post_tool_hook
-        self.audit_log = audit_log if audit_log is not None else []
+        # Caller-provided lists keep receiving dicts; otherwise keep a bounded ring buffer
+        self.audit_log: list[dict] | deque[AuditEntry] = (
+            audit_log if audit_log is not None else deque(maxlen=audit_log_capacity)
+        )
+        self._audit_as_dicts = audit_log is not None
+        # Hooks enqueue entries; a background task flushes them in batches
+        self._audit_queue: asyncio.Queue[AuditEntry] = asyncio.Queue()
+        # Entries the flush task has dequeued but not yet written; drained first
+        self._audit_inflight: list[AuditEntry] = []
+        self._audit_batch_size = audit_batch_size
+        self._audit_flush_interval = audit_flush_interval
+        self._audit_task: asyncio.Task | None = None
+        self._audit_enabled = audit
         self.allowed_tools = allowed_tools
         # Default to loading project settings for slash commands
         self.setting_sources = setting_sources if setting_sources is not None else ["project"]
+        # Yield StreamEvent deltas as they arrive instead of only whole messages
+        self.stream_partials = stream_partials
         self._client: ClaudeSDKClient | None = None
+        # Options are reused across `async with` blocks until the config changes
+        self._cached_options: ClaudeAgentOptions | None = None
+        self._cached_options_key: tuple | None = None
+
+    def enable_audit(self, enabled: bool = True) -> None:
+        """Turn audit logging on or off; disabled hooks skip building entries."""
+        self._audit_enabled = enabled
+
+    def _record_audit(self, entry: AuditEntry) -> None:
+        """Queue an audit entry for the next batch flush."""
+        self._audit_queue.put_nowait(entry)
+
+    def _take_pending_audit(self, limit: int | None = None) -> list[AuditEntry]:
+        """Pop up to ``limit`` queued audit entries without waiting."""
+        batch: list[AuditEntry] = []
+        while limit is None or len(batch) < limit:
+            try:
+                batch.append(self._audit_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    def _flush_audit(self, limit: int | None = None) -> None:
+        """Move the in-flight batch, then up to ``limit`` queued entries, into the log.
+
+        Every drain goes through here so entries land in the order they were recorded.
+        """
+        batch, self._audit_inflight = self._audit_inflight, []
+        if limit is None:
+            batch.extend(self._take_pending_audit())
+        elif limit > len(batch):
+            batch.extend(self._take_pending_audit(limit - len(batch)))
+        if self._audit_as_dicts:
+            self.audit_log.extend(entry.to_dict() for entry in batch)
+        else:
+            self.audit_log.extend(batch)
+
+    async def _audit_flush_loop(self) -> None:
+        """Drain the audit queue in batches of up to ``audit_batch_size``."""
+        while True:
+            self._audit_inflight.append(await self._audit_queue.get())
+            try:
+                await asyncio.sleep(self._audit_flush_interval)
+            finally:
+                self._flush_audit(self._audit_batch_size)
 
     async def _default_permission_callback(
         self,
@@ -48,29 +263,27 @@ class CameronCodeClient:
         context: Any,
     ) -> PermissionResult:
         """Default permission callback - logs and allows most tools."""
-        self.audit_log.append(
-            {
-                "event": "permission_check",
-                "tool": tool_name,
-                "input": tool_input,
-            }
-        )
+        if self._audit_enabled:
+            self._record_audit(
+                AuditEntry(event="permission_check", tool_name=tool_name, tool_input=tool_input)
+            )
+
+        if tool_name in _FAST_PATH_TOOLS and not self.custom_permission_callback:
+            return _ALLOW
 
         # Block dangerous bash commands
         if tool_name == "Bash":
-            command = tool_input.get("command", "")
-            dangerous_patterns = ["rm -rf /", ":(){ :|:& };:", "mkfs", "> /dev/sda"]
-            for pattern in dangerous_patterns:
-                if pattern in command:
-                    return PermissionResultDeny(
-                        message=f"Cameron Code blocked dangerous command: {pattern}"
-                    )
+            match = _DANGEROUS_RE.search(tool_input.get("command", ""))
+            if match:
+                return PermissionResultDeny(
+                    message=f"Cameron Code blocked dangerous command: {match.group(0)}"
+                )
 
         # Delegate to custom callback if provided
         if self.custom_permission_callback:
             return await self.custom_permission_callback(tool_name, tool_input, context)
 
-        return PermissionResultAllow()
+        return _ALLOW
 
     async def _pre_tool_hook(
         self,
@@ -79,19 +292,20 @@ class CameronCodeClient:
         context: Any,
     ) -> dict:
         """Pre-tool execution hook - logs before tool runs."""
-        self.audit_log.append(
-            {
-                "event": "pre_tool",
-                "tool_use_id": tool_use_id,
-                "tool_name": input.get("tool_name"),
-                "tool_input": input.get("tool_input"),
-            }
-        )
+        if self._audit_enabled:
+            self._record_audit(
+                AuditEntry(
+                    event="pre_tool",
+                    tool_name=input["tool_name"],
+                    tool_input=input["tool_input"],
+                    tool_use_id=tool_use_id,
+                )
+            )
 
         if self.custom_pre_tool_hook:
             return await self.custom_pre_tool_hook(input, tool_use_id, context)
 
-        return {"continue_": True}
+        return _HOOK_CONTINUE
 
     async def _post_tool_hook(
         self,
@@ -100,22 +314,36 @@ class CameronCodeClient:
         context: Any,
     ) -> dict:
         """Post-tool execution hook - logs after tool runs."""
-        self.audit_log.append(
-            {
-                "event": "post_tool",
-                "tool_use_id": tool_use_id,
-                "tool_name": input.get("tool_name"),
-                "tool_output": input.get("tool_output"),
-            }
-        )
+        if self._audit_enabled:
+            self._record_audit(
+                AuditEntry(
+                    event="post_tool",
+                    tool_name=input["tool_name"],
+                    tool_output=input["tool_response"],
+                    tool_use_id=tool_use_id,
+                )
+            )
 
         if self.custom_post_tool_hook:
             return await self.custom_post_tool_hook(input, tool_use_id, context)
 
-        return {"continue_": True}
+        return _HOOK_CONTINUE
+
+    def _options_key(self) -> tuple:
+        """Snapshot of the attributes that feed into the built options."""
+        return (
+            self.cwd,
+            tuple(self.allowed_tools) if self.allowed_tools is not None else None,
+            tuple(self.setting_sources),
+            self.stream_partials,
+        )
 
     def _build_options(self) -> ClaudeAgentOptions:
         """Build ClaudeAgentOptions with all Cameron Code features."""
+        key = self._options_key()
+        if self._cached_options is not None and self._cached_options_key == key:
+            return self._cached_options
+
         # Create MCP server with custom tools
         cameron_server = create_sdk_mcp_server(
             name="cameron-tools",
@@ -132,62 +360,88 @@ class CameronCodeClient:
             ],
         }
 
-        return ClaudeAgentOptions(
+        self._cached_options = ClaudeAgentOptions(
             cwd=self.cwd,
             can_use_tool=self._default_permission_callback,
             mcp_servers={"cameron": cameron_server},
             hooks=hooks,
             allowed_tools=self.allowed_tools,
             setting_sources=self.setting_sources,  # Enable slash commands
+            include_partial_messages=self.stream_partials,
         )
+        self._cached_options_key = key
+        return self._cached_options
 
     async def __aenter__(self) -> "CameronCodeClient":
         """Async context manager entry."""
         options = self._build_options()
         self._client = ClaudeSDKClient(options)
         await self._client.__aenter__()
+        self._audit_task = asyncio.create_task(self._audit_flush_loop())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
-        if self._client:
-            await self._client.__aexit__(exc_type, exc_val, exc_tb)
+        try:
+            if self._client:
+                await self._client.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
             self._client = None
+            # Stop the flush task and keep queued entries even if the SDK exit failed
+            if self._audit_task:
+                self._audit_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._audit_task
+                self._audit_task = None
+            self._flush_audit()
 
+    @_requires_connection
     async def connect(self, prompt: str | None = None) -> None:
         """Connect to Claude Code with optional initial prompt."""
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
         await self._client.connect(prompt)
 
+    @_requires_connection
     async def query(self, prompt: str) -> None:
         """Send a query to the connected session."""
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
         await self._client.query(prompt)
 
-    async def receive_response(self) -> AsyncIterator[Message]:
-        """Receive messages until a result is returned."""
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        async for message in self._client.receive_response():
-            yield message
+    @_requires_connection
+    def receive_response(self) -> AsyncIterator[Message]:
+        """Receive messages until a result is returned.
+
+        With ``stream_partials`` enabled, text arrives as StreamEvent deltas and
+        is stripped from the consolidated AssistantMessage to avoid duplicates.
+        """
+        messages = self._client.receive_response()
+        if self.stream_partials:
+            return _dedupe_streamed_text(messages)
+        return messages
 
-    async def receive_messages(self) -> AsyncIterator[Message]:
+    @_requires_connection
+    def receive_messages(self) -> AsyncIterator[Message]:
         """Receive all messages (doesn't stop at result)."""
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        async for message in self._client.receive_messages():
-            yield message
+        messages = self._client.receive_messages()
+        if self.stream_partials:
+            return _dedupe_streamed_text(messages)
+        return messages
 
     def get_audit_log(self) -> list[dict]:
-        """Get the audit log of all tool executions."""
-        return self.audit_log.copy()
+        """Get the audit log of recent tool executions (oldest first)."""
+        self._flush_audit()
+        if self._audit_as_dicts:
+            return list(self.audit_log)
+        return [entry.to_dict() for entry in self.audit_log]
 
+    def iter_audit_log(self) -> Iterator[dict]:
+        """Iterate a snapshot of the audit log, converting entries lazily."""
+        self._flush_audit()
+        if self._audit_as_dicts:
+            return iter(tuple(self.audit_log))
+        return (entry.to_dict() for entry in tuple(self.audit_log))
+
+    @_requires_connection
     async def get_server_info(self) -> dict | None:
         """Get server info including available slash commands."""
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
         return await self._client.get_server_info()
 
     async def get_available_commands(self) -> list[dict]:
@@ -18,13 +18,20 @@ Community-validated providers (via ANTHROPIC_BASE_URL):
 See: https://github.com/musistudio/claude-code-router for intelligent routing.
 """
 
+import dataclasses
+import functools
+import os
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
+from urllib.parse import urlparse
 
-from claude_agent_sdk import ClaudeAgentOptions
+if TYPE_CHECKING:
+    # Imported lazily at runtime so browsing the catalog doesn't load the SDK
+    from claude_agent_sdk import ClaudeAgentOptions
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderConfig:
     """Configuration for an AI provider."""
 
@@ -38,7 +45,7 @@ class ProviderConfig:
 
 
 # Known provider configurations
-PROVIDERS: dict[str, ProviderConfig] = {
+_PROVIDERS: dict[str, ProviderConfig] = {
     # Official providers
     "anthropic": ProviderConfig(
         name="anthropic",
@@ -110,6 +117,20 @@ PROVIDERS: dict[str, ProviderConfig] = {
     ),
 }
 
+PROVIDERS: Mapping[str, ProviderConfig] = MappingProxyType(_PROVIDERS)
+
+
+def _build_base_url_index() -> dict[str, ProviderConfig]:
+    """Map base URL hosts to providers; the first registered provider wins."""
+    index: dict[str, ProviderConfig] = {}
+    for provider in _PROVIDERS.values():
+        if provider.base_url:
+            index.setdefault(urlparse(provider.base_url).netloc.lower(), provider)
+    return index
+
+
+_BASE_URL_INDEX = _build_base_url_index()
+
 
 def get_provider(name: str) -> ProviderConfig | None:
     """Get a provider configuration by name."""
@@ -169,13 +190,13 @@ def create_custom_provider(
 
 
 def apply_provider_config(
-    options: ClaudeAgentOptions,
+    options: "ClaudeAgentOptions",
     provider: ProviderConfig | str,
     *,
     api_key: str | None = None,
     model_override: str | None = None,
     env_overrides: dict[str, str] | None = None,
-) -> ClaudeAgentOptions:
+) -> "ClaudeAgentOptions":
     """Apply provider configuration to ClaudeAgentOptions.
 
     Args:
@@ -216,20 +237,8 @@ def apply_provider_config(
     if env_overrides:
         env.update(env_overrides)
 
-    # Create new options with provider config
-    return ClaudeAgentOptions(
-        model=options.model,
-        max_turns=options.max_turns,
-        allowed_tools=options.allowed_tools,
-        permission_mode=options.permission_mode,
-        cwd=options.cwd,
-        env=env if env else None,
-        extra_args=options.extra_args,
-        setting_sources=options.setting_sources,
-        hooks=options.hooks,
-        mcp_servers=options.mcp_servers,
-        can_use_tool=options.can_use_tool,
-    )
+    # Copy the options, swapping in the provider environment
+    return dataclasses.replace(options, env=env or None)
 
 
 def create_options_for_provider(
@@ -241,7 +250,7 @@ def create_options_for_provider(
     setting_sources: list[str] | None = None,
     env_overrides: dict[str, str] | None = None,
     **kwargs: Any,
-) -> ClaudeAgentOptions:
+) -> "ClaudeAgentOptions":
     """Create ClaudeAgentOptions configured for a specific provider.
 
     Args:
@@ -277,6 +286,8 @@ def create_options_for_provider(
             model="glm-4.5-air",
         )
     """
+    from claude_agent_sdk import ClaudeAgentOptions
+
     provider = get_provider(provider_name)
     if not provider:
         raise ValueError(f"Unknown provider: {provider_name}")
@@ -296,6 +307,7 @@ def create_options_for_provider(
     )
 
 
+@functools.lru_cache(maxsize=32)
 def get_provider_env_example(provider_name: str) -> str:
     """Get example environment variable setup for a provider.
 
@@ -337,25 +349,33 @@ def get_current_provider_info() -> dict[str, Any]:
         - base_url: Configured base URL (if any)
         - model: Configured model (if any)
     """
-    import os
-
-    base_url = os.environ.get("ANTHROPIC_BASE_URL")
-    model = os.environ.get("ANTHROPIC_MODEL")
-    use_bedrock = os.environ.get("CLAUDE_CODE_USE_BEDROCK")
-    use_vertex = os.environ.get("CLAUDE_CODE_USE_VERTEX")
-
+    info = _provider_info_cached(
+        os.environ.get("ANTHROPIC_BASE_URL"),
+        os.environ.get("ANTHROPIC_MODEL"),
+        os.environ.get("CLAUDE_CODE_USE_BEDROCK"),
+        os.environ.get("CLAUDE_CODE_USE_VERTEX"),
+    )
+    # Hand out a copy so callers can't corrupt the cached entry
+    return dict(info)
+
+
+@functools.lru_cache(maxsize=8)
+def _provider_info_cached(
+    base_url: str | None,
+    model: str | None,
+    use_bedrock: str | None,
+    use_vertex: str | None,
+) -> dict[str, Any]:
+    """Resolve provider info for a given set of environment values."""
     # Check official providers first
     if use_bedrock:
         provider = PROVIDERS["bedrock"]
     elif use_vertex:
         provider = PROVIDERS["vertex"]
     elif base_url:
-        # Try to match base URL to known provider
-        for p in PROVIDERS.values():
-            if p.base_url and p.base_url in base_url:
-                provider = p
-                break
-        else:
+        # Try to match base URL host to known provider
+        provider = _BASE_URL_INDEX.get(urlparse(base_url).netloc.lower())
+        if provider is None:
             # Custom provider
             return {
                 "name": "custom",
@@ -376,3 +396,8 @@ def get_current_provider_info() -> dict[str, Any]:
         "model": model or provider.default_model,
         "official": provider.official,
     }
+
+
+def _reset_provider_cache() -> None:
+    """Clear memoized provider info (rarely needed; results are keyed on env)."""
+    _provider_info_cached.cache_clear()
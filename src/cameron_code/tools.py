@@ -1,7 +1,25 @@
 """Custom MCP tools for Cameron Code."""
 
+import time
+
 from claude_agent_sdk import tool
-from datetime import datetime, timezone
+
+# Simulated knowledge base
+KNOWLEDGE_BASE: dict[str, str] = {
+    "favorite_color": "Cameron's favorite color is blue.",
+    "project": "Cameron is working on extending Claude Code.",
+    "coffee": "Cameron prefers oat milk lattes.",
+}
+
+# (value, lowercased key, lowercased value) so searches only lowercase the query
+_KB_INDEX: list[tuple[str, str, str]] = [
+    (value, key.lower(), value.lower()) for key, value in KNOWLEDGE_BASE.items()
+]
+
+
+def _match_knowledge(needle: str) -> list[str]:
+    """Return knowledge base values whose key or value contains an already-lowercased query."""
+    return [value for value, key, hay in _KB_INDEX if needle in key or needle in hay]
 
 
 @tool(
@@ -18,19 +36,7 @@ from datetime import datetime, timezone
 async def cameron_search(args: dict) -> dict:
     """Simulate searching a private knowledge base."""
     query = args.get("query", "")
-
-    # Simulated knowledge base
-    knowledge = {
-        "favorite_color": "Cameron's favorite color is blue.",
-        "project": "Cameron is working on extending Claude Code.",
-        "coffee": "Cameron prefers oat milk lattes.",
-    }
-
-    # Simple keyword matching
-    results = []
-    for key, value in knowledge.items():
-        if query.lower() in key.lower() or query.lower() in value.lower():
-            results.append(value)
+    results = _match_knowledge(query.lower())
 
     if not results:
         results = [f"No results found for '{query}' in Cameron's knowledge base."]
@@ -50,12 +56,8 @@ async def cameron_search(args: dict) -> dict:
 )
 async def cameron_time(args: dict) -> dict:
     """Return current time."""
-    now = datetime.now(timezone.utc)
+    # strftime on a struct_time skips building a datetime just to format it
+    now = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
     return {
-        "content": [
-            {
-                "type": "text",
-                "text": f"Current UTC time: {now.isoformat()}",
-            }
-        ],
+        "content": [{"type": "text", "text": f"Current UTC time: {now}"}],
     }
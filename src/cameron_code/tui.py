@@ -1,11 +1,28 @@
 """Cameron Code TUI - A simple terminal interface for Claude Code SDK."""
 
 import asyncio
-from typing import Any
-
+import bisect
+import contextlib
+import functools
+import itertools
+import re
+import reprlib
+import sys
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+from rich.console import Group
+from rich.markdown import Markdown as RichMarkdown
+from rich.padding import Padding
+from rich.style import Style
+from rich.text import Text
 from textual import on
-from textual.app import App, ComposeResult
+from textual.app import App, ComposeResult, RenderResult
 from textual.binding import Binding
+from textual.events import MouseScrollUp
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.widgets import (
     Footer,
@@ -19,6 +36,8 @@ from textual.widgets import (
 )
 from textual.widgets.option_list import Option
 from textual.suggester import Suggester
+from textual.timer import Timer
+from textual.widget import AwaitMount
 
 from claude_agent_sdk import (
     ClaudeSDKClient,
@@ -38,8 +57,15 @@ from .tools import cameron_search, cameron_time
 from claude_agent_sdk import create_sdk_mcp_server
 
 
+# In-process MCP server with Cameron's tools, shared by every app instance
+CAMERON_SERVER = create_sdk_mcp_server(
+    name="cameron-tools",
+    tools=[cameron_search, cameron_time],
+)
+
+
 # Custom thinking verbs inspired by tweakcc
-THINKING_VERBS = [
+THINKING_VERBS = (
     "Pondering",
     "Contemplating",
     "Mulling over",
@@ -55,39 +81,199 @@ THINKING_VERBS = [
     "Weighing options",
     "Brainstorming",
     "Synthesizing",
-]
+)
+
+# Display names for chat message roles
+ROLE_DISPLAY = {
+    "user": "You",
+    "assistant": "Cameron",
+    "system": "System",
+    "tool": "Tool",
+    "thinking": "Thinking",
+    "hook": "Hook",
+}
+
+# Pre-rendered role header markup
+ROLE_LABELS = {role: f"[bold]{name}[/bold]" for role, name in ROLE_DISPLAY.items()}
+
+# Pre-built role header classes
+ROLE_CLASSES = {role: f"message-role role-{role}" for role in ROLE_DISPLAY}
+
+# How often streamed assistant text is flushed to its log widget (seconds)
+STREAM_FLUSH_INTERVAL = 0.08
+
+# Shown as the first system message at startup
+WELCOME_TEXT = (
+    "Welcome to **Cameron Code**!\n\n"
+    "**Keybindings:**\n"
+    "- `Ctrl+P` - Toggle command palette\n"
+    "- `Ctrl+M` - Switch model (sonnet/opus/haiku)\n"
+    "- `Ctrl+H` - Toggle hook output\n"
+    "- `Ctrl+L` - Clear chat\n"
+    "- `Tab` - Autocomplete slash commands\n"
+    "- `Esc` - Cancel operation\n\n"
+    "Type `/` to see command suggestions!"
+)
+
+# Fixed Markdown messages, parsed once at import and shown as Rich renderables
+_PRERENDERED = {WELCOME_TEXT: RichMarkdown(WELCOME_TEXT)}
+
+# Characters or prefixes that could change how Markdown renders a message
+_MARKDOWN_SYNTAX_RE = re.compile(r"[`*_#\[\]<>|~&\\\n-]|^\s*(?:\d+[.)]|\+)\s")
+
+# Tool inputs and outputs in hook messages are cut to this many characters
+HOOK_PREVIEW_CHARS = 100
+
+# In-flight tool start times kept for the post-tool hook's duration
+MAX_TOOL_TIMINGS = 128
+
+# Parsed Markdown token streams kept for reuse by identical messages
+MARKDOWN_CACHE_SIZE = 256
+
+# Oldest messages are dropped past this many to keep history bounded
+MAX_MESSAGES = 500
+
+# Messages kept mounted as widgets while following the conversation
+MOUNTED_MESSAGES = 60
+
+# Older messages mounted at a time when scrolling back to the top
+HISTORY_PAGE = 20
+
+# Longest to hold up exit waiting for the SDK to disconnect
+DISCONNECT_TIMEOUT = 1.5
+
+# Thinking blocks are shown truncated to this many characters
+THINKING_PREVIEW_CHARS = 150
+
+# Verbs rotate as output arrives, at most this often (seconds)
+VERB_MIN_INTERVAL = 0.4
+
+# Fallback rotation while a tool runs or the model is silent (seconds)
+VERB_HEARTBEAT_INTERVAL = 1.2
+
+# Most SDK messages rendered together in one batched update
+STREAM_BATCH_SIZE = 32
+
+# Models Ctrl+M cycles through, starting with the default
+MODELS = ("sonnet", "opus", "haiku")
 
 # Tool-specific verbs
 TOOL_VERBS = {
-    "Bash": ["Executing", "Running", "Processing"],
-    "Read": ["Reading", "Scanning", "Loading"],
-    "Write": ["Writing", "Saving", "Creating"],
-    "Edit": ["Editing", "Modifying", "Updating"],
-    "Glob": ["Searching", "Finding", "Locating"],
-    "Grep": ["Searching", "Matching", "Scanning"],
-    "Task": ["Spawning", "Delegating", "Launching"],
-    "WebFetch": ["Fetching", "Downloading", "Retrieving"],
-    "WebSearch": ["Searching", "Querying", "Looking up"],
+    "Bash": ("Executing", "Running", "Processing"),
+    "Read": ("Reading", "Scanning", "Loading"),
+    "Write": ("Writing", "Saving", "Creating"),
+    "Edit": ("Editing", "Modifying", "Updating"),
+    "Glob": ("Searching", "Finding", "Locating"),
+    "Grep": ("Searching", "Matching", "Scanning"),
+    "Task": ("Spawning", "Delegating", "Launching"),
+    "WebFetch": ("Fetching", "Downloading", "Retrieving"),
+    "WebSearch": ("Searching", "Querying", "Looking up"),
 }
 
 
+class _HookRepr(reprlib.Repr):
+    """Size-limited repr that keeps dict keys in insertion order, like str()."""
+
+    def repr_dict(self, x: dict, level: int) -> str:
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{...}"
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in itertools.islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append("...")
+        return "{" + ", ".join(pieces) + "}"
+
+
+# Bounded repr for hook previews, so huge tool inputs are never fully stringified
+_HOOK_REPR = _HookRepr()
+_HOOK_REPR.maxstring = HOOK_PREVIEW_CHARS
+_HOOK_REPR.maxother = HOOK_PREVIEW_CHARS
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to ``limit`` characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _hook_preview(value: Any) -> str:
+    """Shorten a tool input or output for display in a hook message."""
+    text = value if isinstance(value, str) else _HOOK_REPR.repr(value)
+    return _truncate(text, HOOK_PREVIEW_CHARS)
+
+
+_T = TypeVar("_T")
+
+
+async def _batched(source: AsyncIterator[_T], max_batch: int) -> AsyncIterator[list[_T]]:
+    """Yield items from ``source`` in lists of everything that arrived meanwhile.
+
+    A background task drains ``source`` into a queue, so items that land while
+    the consumer is busy rendering are handed over together, up to ``max_batch``.
+    Errors raised by ``source`` surface after the items that preceded them.
+    """
+    queue: asyncio.Queue[_T] = asyncio.Queue()
+    get: asyncio.Future[_T] | None = None
+
+    async def pump() -> None:
+        async for item in source:
+            queue.put_nowait(item)
+
+    pump_task = asyncio.create_task(pump())
+    try:
+        while True:
+            if queue.empty():
+                get = asyncio.ensure_future(queue.get())
+                await asyncio.wait((get, pump_task), return_when=asyncio.FIRST_COMPLETED)
+                if not get.done():
+                    get.cancel()
+                    # Source is exhausted (or failed) with nothing left to hand over
+                    pump_task.result()
+                    return
+                batch = [get.result()]
+                get = None
+            else:
+                batch = [queue.get_nowait()]
+            while len(batch) < max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            yield batch
+    finally:
+        if get is not None:
+            get.cancel()
+        if not pump_task.done():
+            pump_task.cancel()
+            # Wait until the pump has left ``source`` so the next query can read the stream
+            with contextlib.suppress(asyncio.CancelledError):
+                await pump_task
+
+
 class SlashCommandSuggester(Suggester):
     """Suggester for slash commands."""
 
     def __init__(self, commands: list[dict]) -> None:
-        super().__init__(use_cache=False, case_sensitive=False)
+        # The command list is fixed per suggester, so suggestions can be cached
+        super().__init__(use_cache=True, case_sensitive=False)
         self.commands = commands
         self._command_names = [f"/{c['name']}" for c in commands]
+        # Sorted casefolded names (Textual casefolds the input to match) for
+        # bisecting straight to the first prefix match
+        indexed = sorted((name.casefold(), name) for name in self._command_names)
+        self._sorted_keys = [key for key, _ in indexed]
+        self._sorted_names = [name for _, name in indexed]
 
     async def get_suggestion(self, value: str) -> str | None:
         """Get autocomplete suggestion for slash commands."""
         if not value.startswith("/"):
             return None
 
-        value_lower = value.lower()
-        for cmd in self._command_names:
-            if cmd.lower().startswith(value_lower) and cmd.lower() != value_lower:
-                return cmd
+        key = value.casefold()
+        # bisect_right skips names equal to the input, which need no completion
+        i = bisect.bisect_right(self._sorted_keys, key)
+        if i < len(self._sorted_keys) and self._sorted_keys[i].startswith(key):
+            return self._sorted_names[i]
         return None
 
 
@@ -97,224 +283,368 @@ class CommandPalette(Static):
     def __init__(self, commands: list[dict], **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.commands = commands
+        self._option_list = OptionList(*self._options(), id="command-list")
 
     def compose(self) -> ComposeResult:
         yield Label("[bold]Available Commands[/bold]", classes="palette-header")
-        options = []
-        for cmd in self.commands:
-            name = cmd.get("name", "")
-            desc = cmd.get("description", "")[:50]
-            options.append(Option(f"/{name} - {desc}"))
-        yield OptionList(*options, id="command-list")
+        yield self._option_list
 
+    def populate(self, commands: list[dict]) -> None:
+        """Replace the listed commands, reusing the mounted widgets."""
+        self.commands = commands
+        self._option_list.clear_options()
+        self._option_list.add_options(self._options())
 
-class MessageDisplay(Static):
-    """A single message in the chat."""
+    def _options(self) -> list[Option]:
+        """One option per command name; the first entry wins, since ids must be unique."""
+        by_name: dict[str, dict] = {}
+        for cmd in self.commands:
+            by_name.setdefault(f"/{cmd.get('name', '')}", cmd)
+        return [self._option(name, cmd) for name, cmd in by_name.items()]
 
-    def __init__(self, role: str, content: str, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
-        self.role = role
-        self.content = content
+    @staticmethod
+    def _option(name: str, cmd: dict) -> Option:
+        """Build a command's option, keyed by its "/{name}"."""
+        return Option(f"{name} - {cmd.get('description', '')[:40]}", id=name)
 
-    def compose(self) -> ComposeResult:
-        role_display = {
-            "user": "You",
-            "assistant": "Cameron",
-            "system": "System",
-            "tool": "Tool",
-            "thinking": "Thinking",
-            "hook": "Hook",
-        }.get(self.role, self.role)
 
-        role_class = f"role-{self.role}"
-        yield Label(f"[bold]{role_display}[/bold]", classes=f"message-role {role_class}")
-        yield Markdown(self.content, classes="message-content")
+class StreamingAssistant(Static):
+    """Growing plain-text view of assistant text while it is still streaming."""
 
+    DEFAULT_CSS = """
+    StreamingAssistant {
+        height: auto;
+        background: transparent;
+    }
+    """
 
-class ThinkingIndicator(Static):
-    """Animated thinking indicator with custom verbs."""
+    def __init__(self, **kwargs: Any) -> None:
+        # Plain text: model output isn't Rich markup, and Markdown replaces it when done
+        super().__init__(markup=False, **kwargs)
+        self._text = Text()
 
-    def __init__(self, tool_name: str | None = None, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
-        self.tool_name = tool_name
-        self.verb_index = 0
+    def write(self, text: str) -> None:
+        """Append text to the running reply, continuing the current line."""
+        self._text.append(text)
+        self.update(self._text)
 
-        if tool_name and tool_name in TOOL_VERBS:
-            self.verbs = TOOL_VERBS[tool_name]
-        else:
-            self.verbs = THINKING_VERBS
 
-    def compose(self) -> ComposeResult:
-        yield LoadingIndicator()
-        initial_verb = self.verbs[0]
-        if self.tool_name:
-            initial_verb = f"{initial_verb} ({self.tool_name})"
-        yield Label(initial_verb, id="thinking-verb")
+class _MemoizedMarkdownIt(MarkdownIt):
+    """MarkdownIt that remembers the token streams of recently parsed documents."""
 
-    def on_mount(self) -> None:
-        self.set_interval(0.6, self._rotate_verb)
+    def __init__(self) -> None:
+        # Same preset Textual's Markdown widget uses by default
+        super().__init__("gfm-like")
+        self._parse_cached = functools.lru_cache(maxsize=MARKDOWN_CACHE_SIZE)(self._parse_tokens)
 
-    def _rotate_verb(self) -> None:
-        self.verb_index = (self.verb_index + 1) % len(self.verbs)
-        verb = self.verbs[self.verb_index]
-        if self.tool_name:
-            verb = f"{verb} ({self.tool_name})"
-        try:
-            verb_label = self.query_one("#thinking-verb", Label)
-            verb_label.update(verb)
-        except Exception:
-            pass
+    def _parse_tokens(self, src: str) -> tuple[Token, ...]:
+        return tuple(super().parse(src))
 
+    def parse(self, src: str, env: Any = None) -> list[Token]:
+        if env is not None:
+            return super().parse(src, env)
+        return list(self._parse_cached(src))
 
-class ChatContainer(VerticalScroll):
-    """Container for chat messages."""
 
-    def add_message(self, role: str, content: str) -> None:
-        msg = MessageDisplay(role, content)
-        self.mount(msg)
-        self.scroll_end(animate=False)
+@functools.cache
+def _markdown_parser() -> MarkdownIt:
+    """Shared parser for every Markdown message, instead of one per widget update."""
+    return _MemoizedMarkdownIt()
 
 
-class CameronCodeApp(App):
-    """Cameron Code TUI Application."""
+def _content_widget(content: str) -> Static | Markdown:
+    """Render plain one-line text as a Static, anything else as Markdown."""
+    prerendered = _PRERENDERED.get(content)
+    if prerendered is not None:
+        return Static(prerendered, classes="message-content")
+    if _MARKDOWN_SYNTAX_RE.search(content):
+        return Markdown(content, classes="message-content", parser_factory=_markdown_parser)
+    return Static(content, markup=False, classes="message-content")
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
 
-    #main-container {
-        height: 1fr;
-    }
+class MessageDisplay(Static):
+    """A single message in the chat.
 
-    #chat-container {
-        height: 1fr;
-        padding: 1;
-        border: solid $primary;
-    }
+    Plain-text messages render their role header and body as one widget;
+    Markdown and streaming messages compose a role Label plus a body widget.
+    ``markdown`` forces either form; by default it's inferred from the content.
+    """
 
-    #command-palette {
-        width: 40;
-        height: 100%;
-        dock: right;
-        background: $surface-darken-2;
-        border-left: solid $primary;
-        padding: 1;
-        display: none;
-    }
+    COMPONENT_CLASSES = {"message-display--role", "message-display--body"}
 
-    #command-palette.visible {
-        display: block;
-    }
+    def __init__(
+        self,
+        role: str,
+        content: str,
+        *,
+        streaming: bool = False,
+        markdown: bool | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(markup=False, **kwargs)
+        self.role = role
+        self.content = content
+        self.streaming = streaming
+        if markdown is None:
+            markdown = bool(_MARKDOWN_SYNTAX_RE.search(content))
+        self._single_widget = not streaming and not markdown
+        if self._single_widget:
+            self.add_class(f"message-{role}")
+
+    def update(self, content: str = "", *, layout: bool = True) -> None:
+        """Replace a single-widget message's text and repaint it.
+
+        ``render`` reads ``self.content``, so set it directly and refresh;
+        older Textual releases don't repaint on a bare ``content`` assignment.
+        """
+        self.content = content
+        self.refresh(layout=layout)
+
+    def render(self) -> RenderResult:
+        if not self._single_widget:
+            # Children draw the message; don't paint the raw content under them
+            return ""
+        header = Text(
+            ROLE_DISPLAY.get(self.role, self.role),
+            style=self.get_component_rich_style("message-display--role") + Style(bold=True),
+        )
+        # Same spacing as the Label + Static pair: blank line, indented body
+        body = Text(str(self.content), style=self.get_component_rich_style("message-display--body"))
+        return Group(header, Text(), Padding(body, (0, 0, 1, 2)))
 
-    .palette-header {
-        margin-bottom: 1;
-        text-style: bold;
-        color: $primary;
-    }
+    def compose(self) -> ComposeResult:
+        if self._single_widget:
+            return
+        role = self.role
+        yield Label(
+            ROLE_LABELS.get(role) or f"[bold]{role}[/bold]",
+            classes=ROLE_CLASSES.get(role) or f"message-role role-{role}",
+        )
+        if self.streaming:
+            yield StreamingAssistant(classes="message-content")
+        else:
+            yield _content_widget(self.content)
 
-    #command-list {
-        height: 1fr;
-    }
+    async def finish_streaming(self, content: str) -> None:
+        """Swap the streaming log for a fully rendered Markdown body."""
+        self.content = content
+        self.streaming = False
+        if not self.is_attached:
+            # Cleared from the chat mid-stream; nothing left to render into
+            return
+        await self.query(StreamingAssistant).remove()
+        await self.mount(_content_widget(content))
 
-    MessageDisplay {
-        margin-bottom: 1;
-        padding: 1;
-        background: $surface-darken-1;
-    }
 
-    .message-role {
-        margin-bottom: 1;
-    }
+@functools.lru_cache(maxsize=64)
+def _indicator_verbs(tool_name: str | None) -> tuple[str, ...]:
+    """Fully formatted verb labels to rotate through for an activity."""
+    if not tool_name:
+        return THINKING_VERBS
+    verbs = TOOL_VERBS.get(tool_name, THINKING_VERBS)
+    return tuple(f"{verb} ({tool_name})" for verb in verbs)
 
-    .role-user {
-        color: $success;
-    }
 
-    .role-assistant {
-        color: $primary;
-    }
+class ThinkingIndicator(Static):
+    """Animated thinking indicator with custom verbs.
 
-    .role-system {
-        color: $warning;
-    }
+    One indicator is reused for the whole session; ``start`` and ``stop`` show
+    and hide it and resume or pause its heartbeat timer. Verbs advance on
+    ``bump``, called as output arrives, with the heartbeat covering quiet spells.
+    """
 
-    .role-tool {
-        color: $secondary;
-    }
+    def __init__(self, tool_name: str | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._timer: Timer | None = None
+        self._verb_label: Label | None = None
+        self._rotated_at = 0.0
+        self._set_tool(tool_name)
 
-    .role-thinking {
-        color: $text-muted;
-        text-style: italic;
-    }
+    def _set_tool(self, tool_name: str | None) -> None:
+        self.tool_name = tool_name
+        self._verbs = itertools.cycle(_indicator_verbs(tool_name))
+        self._verb = next(self._verbs)
 
-    .role-hook {
-        color: #888888;
-        text-style: dim;
-    }
+    def compose(self) -> ComposeResult:
+        yield LoadingIndicator()
+        self._verb_label = Label(self._verb, id="thinking-verb")
+        yield self._verb_label
 
-    .message-content {
-        padding-left: 2;
-    }
+    def on_mount(self) -> None:
+        self._timer = self.set_interval(
+            VERB_HEARTBEAT_INTERVAL, self.bump, pause=not self.display
+        )
 
-    #input-container {
-        height: auto;
-        dock: bottom;
-        padding: 1;
-    }
+    def start(self, tool_name: str | None = None) -> None:
+        """Show the indicator for a new activity and resume rotating verbs."""
+        self._set_tool(tool_name)
+        self._update_verb()
+        self._rotated_at = time.monotonic()
+        self.display = True
+        if self._timer:
+            # reset() also resumes, restarting the interval from now
+            self._timer.reset()
+
+    def stop(self) -> None:
+        """Hide the indicator and pause its timer."""
+        if self._timer:
+            self._timer.pause()
+        self.display = False
+
+    def bump(self) -> None:
+        """Advance the verb unless it changed within ``VERB_MIN_INTERVAL``."""
+        if not self.display:
+            return
+        now = time.monotonic()
+        if now - self._rotated_at >= VERB_MIN_INTERVAL:
+            self._rotated_at = now
+            self._rotate_verb()
 
-    #prompt-input {
-        width: 100%;
-    }
+    def _rotate_verb(self) -> None:
+        self._verb = next(self._verbs)
+        self._update_verb()
 
-    #status-bar {
-        dock: bottom;
-        height: 1;
-        background: $primary-darken-2;
-        padding: 0 1;
-    }
+    def _update_verb(self) -> None:
+        if self._verb_label is not None:
+            self._verb_label.update(self._verb)
 
-    ThinkingIndicator {
-        height: 3;
-        align: center middle;
-    }
 
-    ThinkingIndicator LoadingIndicator {
-        width: auto;
-    }
+class ChatContainer(VerticalScroll):
+    """Container for chat messages.
 
-    #thinking-verb {
-        margin-left: 1;
-        color: $text-muted;
-        text-style: italic;
-    }
+    Only the newest ``mounted_messages`` messages are kept as widgets while the
+    view follows the conversation; older ones are stored as plain records and
+    mounted again, a page at a time, when the user scrolls to the top.
+    """
 
-    #cost-display {
-        dock: right;
-        width: auto;
-    }
+    def __init__(
+        self,
+        max_messages: int = MAX_MESSAGES,
+        mounted_messages: int = MOUNTED_MESSAGES,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._scroll_pending = False
+        self._max_messages = max_messages
+        self._mounted_messages = mounted_messages
+        self._messages: deque[MessageDisplay] = deque()
+        # (role, content, markdown) for messages scrolled out of the mounted window
+        self._offscreen: deque[tuple[str, str, bool]] = deque()
+        # Group key of the newest message, how many posts it has absorbed,
+        # its header line and the detail lines of every post folded into it
+        self._last_group: str | None = None
+        self._group_count = 0
+        self._group_head = ""
+        self._group_lines: list[str] = []
+
+    def add_message(
+        self,
+        role: str,
+        content: str,
+        *,
+        markdown: bool | None = None,
+        group: str | None = None,
+    ) -> None:
+        """Add a message, folding it into the newest one if both share ``group``.
+
+        A folded message keeps its first header line with a ``(×N)`` count and
+        appends each later post's details below it instead of mounting another
+        widget. A post whose header differs keeps that header too.
+        """
+        last = self._messages[-1] if self._messages else None
+        head, _, rest = content.partition("\n")
+        if group is not None and group == self._last_group and last and last._single_widget:
+            self._group_count += 1
+            if head != self._group_head:
+                self._group_lines.append(head)
+            if rest:
+                self._group_lines.append(rest)
+            header = f"{self._group_head} (×{self._group_count})"
+            last.update("\n".join([header, *self._group_lines]))
+            return
+        self.mount_message(MessageDisplay(role, content, markdown=markdown))
+        self._last_group = group
+        self._group_count = 1
+        self._group_head = head
+        self._group_lines = [rest] if rest else []
+        self.request_scroll_end()
+
+    def mount_message(self, msg: MessageDisplay) -> AwaitMount:
+        """Mount a message, unmounting or dropping the oldest ones past the limits."""
+        self._last_group = None
+        following = self._following_tail()
+        self._messages.append(msg)
+        while len(self._messages) + len(self._offscreen) > self._max_messages:
+            if self._offscreen:
+                self._offscreen.popleft()
+            else:
+                self._messages.popleft().remove()
+        # Don't shift content out from under a user reading older messages
+        if following:
+            while len(self._messages) > self._mounted_messages:
+                self._unmount_oldest()
+        return self.mount(msg)
+
+    def clear_messages(self) -> None:
+        """Remove every message from the chat."""
+        self.remove_children(list(self._messages))
+        self._messages.clear()
+        self._offscreen.clear()
+        self._last_group = None
+
+    def _following_tail(self) -> bool:
+        return self._scroll_pending or self.scroll_y >= self.max_scroll_y
+
+    def _unmount_oldest(self) -> None:
+        msg = self._messages.popleft()
+        self._offscreen.append((msg.role, str(msg.content), not msg._single_widget))
+        msg.remove()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if new_value <= 0 and new_value < old_value and self._offscreen:
+            self._mount_older()
+
+    def on_mouse_scroll_up(self, event: MouseScrollUp) -> None:
+        # Scrolling up with nowhere to go, e.g. the mounted window fits on screen
+        if self.scroll_y <= 0 and self._offscreen:
+            self._mount_older()
+
+    def _mount_older(self) -> None:
+        """Mount the previous page of history above the oldest mounted message."""
+        first = self._messages[0] if self._messages else None
+        first_y = first.virtual_region.y if first else 0
+        page: list[MessageDisplay] = []
+        while self._offscreen and len(page) < HISTORY_PAGE:
+            role, content, markdown = self._offscreen.pop()
+            page.append(MessageDisplay(role, content, markdown=markdown))
+        page.reverse()
+        self._messages.extendleft(reversed(page))
+        self.mount(*page, before=first)
+
+        def keep_position() -> None:
+            # Hold the previously top message where it was on screen
+            if first is not None:
+                self.scroll_to(y=first.virtual_region.y - first_y, animate=False)
+
+        self.call_after_refresh(keep_position)
+
+    def request_scroll_end(self) -> None:
+        """Scroll to the bottom after the next refresh, once per burst of calls."""
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        self.call_after_refresh(self._scroll_to_end)
 
-    #model-display {
-        dock: right;
-        width: auto;
-        margin-right: 2;
-        color: $text-muted;
-    }
+    def _scroll_to_end(self) -> None:
+        self._scroll_pending = False
+        self.scroll_end(animate=False)
 
-    #turns-display {
-        dock: right;
-        width: auto;
-        margin-right: 2;
-        color: $text-muted;
-    }
 
-    #provider-display {
-        dock: right;
-        width: auto;
-        margin-right: 2;
-        color: $accent;
-    }
-    """
+class CameronCodeApp(App):
+    """Cameron Code TUI Application."""
+
+    CSS_PATH = "cameron.tcss"
 
     BINDINGS = [
         Binding("ctrl+c", "quit", "Quit"),
@@ -332,15 +662,51 @@ class CameronCodeApp(App):
         self.total_cost: float = 0.0
         self.total_turns: int = 0
         self.is_processing = False
-        self._thinking_indicator: ThinkingIndicator | None = None
-        self.current_model = "sonnet"
+        # Set by action_cancel; the running query stops rendering and drains to its result
+        self._cancel_requested = asyncio.Event()
+        self._thinking_indicator = ThinkingIndicator()
+        self._thinking_indicator.display = False
+        self.current_model = MODELS[0]
+        # Positioned on current_model; next() yields the model to switch to
+        self._model_cycle = itertools.cycle(MODELS)
+        next(self._model_cycle)
         self.show_hooks = False
         self.tool_timings: dict[str, float] = {}
         self.available_commands: list[dict] = []
         self.palette_visible = False
+        # Assistant message currently receiving streamed text
+        self._stream_display: MessageDisplay | None = None
+        self._stream_log: StreamingAssistant | None = None
+        self._stream_parts: list[str] = []
+        self._stream_pending: list[str] = []
+        self._stream_timer: Timer | None = None
+        self._disconnect_task: asyncio.Task[None] | None = None
+        # Exact message and content block type -> bound handler; SDK types aren't subclassed
+        self._message_handlers: dict[type, Callable[[Any], Awaitable[None]]] = {
+            AssistantMessage: self._handle_assistant_message,
+            ResultMessage: self._handle_result_message,
+        }
+        self._block_handlers: dict[type, Callable[[Any], Awaitable[None]]] = {
+            TextBlock: self._handle_text_block,
+            ToolUseBlock: self._handle_tool_block,
+            ThinkingBlock: self._handle_thinking_block,
+        }
+        # Hot-path widgets, resolved once in on_mount
+        self._chat: ChatContainer
+        self._status: Label
+        self._cost: Label
+        self._turns: Label
+        self._input: Input
+        self._palette: CommandPalette
+        self._model_label: Label
+        # Last text shown in each footer label, to skip no-op repaints
+        self._last_status = ""
+        self._last_cost = ""
+        self._last_turns = ""
 
     def compose(self) -> ComposeResult:
-        yield Header(show_clock=True)
+        # No clock: its 1s tick would repaint the header throughout streaming
+        yield Header()
         with Horizontal(id="main-container"):
             yield ChatContainer(id="chat-container")
             yield CommandPalette([], id="command-palette")
@@ -356,23 +722,22 @@ class CameronCodeApp(App):
 
     async def on_mount(self) -> None:
         """Initialize the Claude client on mount."""
-        self.query_one("#prompt-input", Input).focus()
-
-        chat = self.query_one("#chat-container", ChatContainer)
-        chat.add_message(
-            "system",
-            "Welcome to **Cameron Code**!\n\n"
-            "**Keybindings:**\n"
-            "- `Ctrl+P` - Toggle command palette\n"
-            "- `Ctrl+M` - Switch model (sonnet/opus/haiku)\n"
-            "- `Ctrl+H` - Toggle hook output\n"
-            "- `Ctrl+L` - Clear chat\n"
-            "- `Tab` - Autocomplete slash commands\n"
-            "- `Esc` - Cancel operation\n\n"
-            "Type `/` to see command suggestions!"
-        )
+        self._input = self.query_one("#prompt-input", Input)
+        self._input.focus()
+
+        self._chat = self.query_one("#chat-container", ChatContainer)
+        self._status = self.query_one("#status-label", Label)
+        self._cost = self.query_one("#cost-display", Label)
+        self._turns = self.query_one("#turns-display", Label)
+        self._palette = self.query_one("#command-palette", CommandPalette)
+        self._model_label = self.query_one("#model-display", Label)
+        self._chat.mount(self._thinking_indicator)
+
+        # Start connecting first so the SDK handshake overlaps the welcome render
+        self._update_status("Connecting...")
+        self.run_worker(self._init_client(), name="init-client", exclusive=True)
 
-        await self._init_client()
+        self._chat.add_message("system", WELCOME_TEXT)
 
     async def _pre_tool_hook(
         self,
@@ -382,15 +747,21 @@ class CameronCodeApp(App):
     ) -> dict:
         """Pre-tool hook - show what's about to run."""
         tool_name = input.get("tool_name", "Unknown")
-        self.tool_timings[tool_use_id] = asyncio.get_event_loop().time()
 
         if self.show_hooks:
-            chat = self.query_one("#chat-container", ChatContainer)
-            tool_input = input.get("tool_input", {})
-            preview = str(tool_input)[:100]
-            if len(str(tool_input)) > 100:
-                preview += "..."
-            chat.add_message("hook", f"**PreToolUse**: {tool_name}\n```\n{preview}\n```")
+            # Durations are only ever shown in hook messages
+            timings = self.tool_timings
+            timings[tool_use_id] = time.monotonic()
+            # Calls that never finish (interrupted, failed) would otherwise pile up
+            if len(timings) > MAX_TOOL_TIMINGS:
+                del timings[next(iter(timings))]
+            preview = _hook_preview(input.get("tool_input", {}))
+            self._chat.add_message(
+                "hook",
+                f"PreToolUse: {tool_name}\n{preview}",
+                markdown=False,
+                group=f"PreToolUse:{tool_name}",
+            )
 
         self._show_thinking(tool_name)
         return {"continue_": True}
@@ -405,33 +776,26 @@ class CameronCodeApp(App):
         tool_name = input.get("tool_name", "Unknown")
 
         start_time = self.tool_timings.pop(tool_use_id, None)
-        if start_time:
-            duration = asyncio.get_event_loop().time() - start_time
-            duration_str = f"{duration:.2f}s"
-        else:
-            duration_str = "?"
 
         if self.show_hooks:
-            chat = self.query_one("#chat-container", ChatContainer)
-            output = input.get("tool_output", "")
-            if isinstance(output, str):
-                preview = output[:100]
-                if len(output) > 100:
-                    preview += "..."
+            if start_time:
+                duration = time.monotonic() - start_time
+                duration_str = f"{duration:.2f}s"
             else:
-                preview = str(output)[:100]
-            chat.add_message("hook", f"**PostToolUse**: {tool_name} ({duration_str})\n```\n{preview}\n```")
+                duration_str = "?"
+            preview = _hook_preview(input.get("tool_response", ""))
+            self._chat.add_message(
+                "hook",
+                f"PostToolUse: {tool_name} ({duration_str})\n{preview}",
+                markdown=False,
+                group=f"PostToolUse:{tool_name}",
+            )
 
         self._hide_thinking()
         return {"continue_": True}
 
     async def _init_client(self) -> None:
         """Initialize the Claude SDK client."""
-        cameron_server = create_sdk_mcp_server(
-            name="cameron-tools",
-            tools=[cameron_search, cameron_time],
-        )
-
         hooks = {
             "PreToolUse": [
                 HookMatcher(matcher="*", hooks=[self._pre_tool_hook]),
@@ -442,54 +806,111 @@ class CameronCodeApp(App):
         }
 
         options = ClaudeAgentOptions(
-            mcp_servers={"cameron": cameron_server},
+            mcp_servers={"cameron": CAMERON_SERVER},
             setting_sources=["user", "project"],
             hooks=hooks,
             cwd=".",
             max_turns=25,
         )
 
-        self.client = ClaudeSDKClient(options)
-        await self.client.connect()
+        client = ClaudeSDKClient(options)
+        await client.connect()
+        # Only expose the client once connected so queries never hit a half-open session
+        self.client = client
+        self._update_status("Ready")
 
         # Get available commands and set up autocomplete
-        info = await self.client.get_server_info()
+        info = await client.get_server_info()
         if info:
             self.available_commands = info.get("commands", [])
             if self.available_commands:
                 # Update input with suggester
-                input_widget = self.query_one("#prompt-input", Input)
-                input_widget.suggester = SlashCommandSuggester(self.available_commands)
+                self._input.suggester = SlashCommandSuggester(self.available_commands)
 
                 # Update command palette
-                palette = self.query_one("#command-palette", CommandPalette)
-                palette.commands = self.available_commands
-                palette.refresh()
+                self._palette.populate(self.available_commands)
 
                 cmd_list = ", ".join(f"`/{c['name']}`" for c in self.available_commands[:5])
-                chat = self.query_one("#chat-container", ChatContainer)
+                chat = self._chat
                 chat.add_message("system", f"Commands: {cmd_list}... (Ctrl+P for all)")
 
     def _update_status(self, text: str) -> None:
-        self.query_one("#status-label", Label).update(text)
+        if text == self._last_status:
+            return
+        self._last_status = text
+        self._status.update(text)
 
     def _update_cost(self) -> None:
-        self.query_one("#cost-display", Label).update(f"${self.total_cost:.4f}")
+        text = f"${self.total_cost:.4f}"
+        if text == self._last_cost:
+            return
+        self._last_cost = text
+        self._cost.update(text)
 
     def _update_turns(self) -> None:
-        self.query_one("#turns-display", Label).update(f"turns: {self.total_turns}")
+        text = f"turns: {self.total_turns}"
+        if text == self._last_turns:
+            return
+        self._last_turns = text
+        self._turns.update(text)
 
     def _show_thinking(self, tool_name: str | None = None) -> None:
-        self._hide_thinking()
-        self._thinking_indicator = ThinkingIndicator(tool_name=tool_name)
-        chat = self.query_one("#chat-container", ChatContainer)
-        chat.mount(self._thinking_indicator)
-        chat.scroll_end(animate=False)
+        chat = self._chat
+        indicator = self._thinking_indicator
+        last = chat.children[-1] if chat.children else None
+        if indicator.display and indicator.tool_name == tool_name and last is indicator:
+            # Already showing this activity in place; keep its rotation going
+            return
+        # Keep the shared indicator below the newest message
+        if last is not None and last is not indicator:
+            chat.move_child(indicator, after=chat.children[-1])
+        indicator.start(tool_name)
+        chat.request_scroll_end()
 
     def _hide_thinking(self) -> None:
-        if self._thinking_indicator:
-            self._thinking_indicator.remove()
-            self._thinking_indicator = None
+        if self._thinking_indicator.display:
+            self._thinking_indicator.stop()
+
+    async def _append_stream(self, text: str) -> None:
+        """Append assistant text, mounting the streaming message on first use."""
+        if self._stream_log is None:
+            if not text.strip():
+                return
+            self._hide_thinking()
+            chat = self._chat
+            self._stream_display = MessageDisplay("assistant", "", streaming=True)
+            await chat.mount_message(self._stream_display)
+            self._stream_log = self._stream_display.query_one(StreamingAssistant)
+            self._stream_timer = self.set_interval(STREAM_FLUSH_INTERVAL, self._flush_stream)
+
+        self._stream_parts.append(text)
+        self._stream_pending.append(text)
+
+    def _flush_stream(self) -> None:
+        """Append buffered text to the log; coalesces bursts into one write per tick."""
+        if not self._stream_pending or self._stream_log is None:
+            return
+        self._stream_log.write("".join(self._stream_pending))
+        self._stream_pending.clear()
+        self._chat.request_scroll_end()
+
+    async def _end_stream(self) -> None:
+        """Replace the streamed log with the final Markdown rendering."""
+        display = self._stream_display
+        content = "".join(self._stream_parts)
+        self._detach_stream()
+        if display is not None and display.is_attached:
+            await display.finish_streaming(content)
+
+    def _detach_stream(self) -> None:
+        """Forget the streaming message; later text starts a new one."""
+        if self._stream_timer:
+            self._stream_timer.stop()
+            self._stream_timer = None
+        self._stream_display = None
+        self._stream_log = None
+        self._stream_parts.clear()
+        self._stream_pending.clear()
 
     @on(Input.Changed, "#prompt-input")
     def on_input_changed(self, event: Input.Changed) -> None:
@@ -509,19 +930,21 @@ class CameronCodeApp(App):
 
         event.input.value = ""
 
-        chat = self.query_one("#chat-container", ChatContainer)
+        chat = self._chat
         chat.add_message("user", prompt)
 
-        await self._process_query(prompt)
+        # Claim the session now so a second Enter can't start a query before the worker runs
+        self.is_processing = True
+        # Run outside this handler so keys, including Escape to cancel, keep being handled
+        self.run_worker(self._process_query(prompt), name="query", group="query")
 
     @on(OptionList.OptionSelected, "#command-list")
     def on_command_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle command selection from palette."""
-        # Extract command name from "/{name} - {desc}"
-        option_text = str(event.option.prompt)
-        cmd_name = option_text.split(" - ")[0]
+        # Options are keyed by their "/{name}" command
+        cmd_name = event.option.id
 
-        input_widget = self.query_one("#prompt-input", Input)
+        input_widget = self._input
         input_widget.value = cmd_name + " "
         input_widget.focus()
 
@@ -531,132 +954,169 @@ class CameronCodeApp(App):
     async def _process_query(self, prompt: str) -> None:
         """Process a query through Claude."""
         if not self.client:
+            self.is_processing = False
+            self._chat.add_message("system", "Still connecting to Claude, try again in a moment.")
             return
 
         self.is_processing = True
+        self._cancel_requested.clear()
         self._update_status("Processing...")
         self._show_thinking()
 
-        chat = self.query_one("#chat-container", ChatContainer)
+        chat = self._chat
 
         try:
             await self.client.query(prompt)
 
-            current_text = ""
-
-            async for msg in self.client.receive_response():
-                if isinstance(msg, AssistantMessage):
-                    for block in msg.content:
-                        if isinstance(block, TextBlock):
-                            current_text += block.text
-                        elif isinstance(block, ToolUseBlock):
-                            if current_text.strip():
-                                self._hide_thinking()
-                                chat.add_message("assistant", current_text)
-                                current_text = ""
-                            chat.add_message("tool", f"**{block.name}**")
-                        elif isinstance(block, ThinkingBlock):
-                            if block.thinking:
-                                preview = block.thinking[:150]
-                                if len(block.thinking) > 150:
-                                    preview += "..."
-                                chat.add_message("thinking", f"_{preview}_")
-
-                elif isinstance(msg, ResultMessage):
-                    self._hide_thinking()
-                    if current_text.strip():
-                        chat.add_message("assistant", current_text)
-                        current_text = ""
-
-                    if msg.total_cost_usd:
-                        self.total_cost += msg.total_cost_usd
-                        self._update_cost()
-
-                    if msg.num_turns:
-                        self.total_turns += msg.num_turns
-                        self._update_turns()
-
-                    self._update_status("Ready")
+            batches = _batched(self.client.receive_response(), STREAM_BATCH_SIZE)
+            async with contextlib.aclosing(batches):
+                async for batch in batches:
+                    self._thinking_indicator.bump()
+                    # One compositor pass per batch, however many blocks it mounts
+                    with self.batch_update():
+                        handlers = self._message_handlers
+                        for msg in batch:
+                            handler = handlers.get(type(msg))
+                            if handler:
+                                await handler(msg)
 
         except Exception as e:
-            self._hide_thinking()
             chat.add_message("system", f"**Error:** {e}")
             self._update_status("Error")
 
         finally:
+            # Single hide point for every exit path: result, error or cancel
+            await self._end_stream()
             self.is_processing = False
             self._hide_thinking()
-            self._update_status("Ready")
+            self._update_status("Cancelled" if self._cancel_requested.is_set() else "Ready")
+
+    async def _handle_assistant_message(self, msg: AssistantMessage) -> None:
+        if self._cancel_requested.is_set():
+            # Output still in flight after an interrupt is drained, not shown
+            return
+        handlers = self._block_handlers
+        for block in msg.content:
+            handler = handlers.get(type(block))
+            if handler:
+                await handler(block)
+
+    async def _handle_result_message(self, msg: ResultMessage) -> None:
+        await self._end_stream()
+        # The turn is over; any start time left belongs to a call that never finished
+        self.tool_timings.clear()
+
+        if msg.total_cost_usd:
+            self.total_cost += msg.total_cost_usd
+            self._update_cost()
+
+        if msg.num_turns:
+            self.total_turns += msg.num_turns
+            self._update_turns()
+
+        self._update_status("Ready")
+
+    async def _handle_text_block(self, block: TextBlock) -> None:
+        await self._append_stream(block.text)
+
+    async def _handle_tool_block(self, block: ToolUseBlock) -> None:
+        await self._end_stream()
+        # Tool names and thinking previews are shown verbatim, skipping Markdown
+        self._chat.add_message("tool", block.name, markdown=False)
+
+    async def _handle_thinking_block(self, block: ThinkingBlock) -> None:
+        if block.thinking:
+            preview = _truncate(block.thinking, THINKING_PREVIEW_CHARS)
+            self._chat.add_message("thinking", preview, markdown=False)
 
     def action_clear(self) -> None:
         """Clear the chat history."""
-        chat = self.query_one("#chat-container", ChatContainer)
-        chat.remove_children()
+        # A reply may still be streaming into a message that's about to go
+        self._detach_stream()
+        chat = self._chat
+        chat.clear_messages()
         chat.add_message("system", "Chat cleared.")
 
+    async def action_quit(self) -> None:
+        """Start disconnecting before exit so it overlaps UI teardown."""
+        self._start_disconnect()
+        self.exit()
+
     async def action_cancel(self) -> None:
         """Cancel current operation."""
-        if self.client and self.is_processing:
+        if self.client and self.is_processing and not self._cancel_requested.is_set():
+            self._cancel_requested.set()
             await self.client.interrupt()
+            # Interrupted tool calls won't reach the post-tool hook
+            self.tool_timings.clear()
             self._hide_thinking()
-            self._update_status("Cancelled")
-            self.is_processing = False
+            self._update_status("Cancelling...")
 
     async def action_switch_model(self) -> None:
         """Switch between models."""
         if not self.client:
             return
 
-        models = ["sonnet", "opus", "haiku"]
-        current_idx = models.index(self.current_model) if self.current_model in models else 0
-        next_idx = (current_idx + 1) % len(models)
-        self.current_model = models[next_idx]
+        self.current_model = next(self._model_cycle)
 
         await self.client.set_model(self.current_model)
-        self.query_one("#model-display", Label).update(self.current_model)
+        self._model_label.update(self.current_model)
 
-        chat = self.query_one("#chat-container", ChatContainer)
+        chat = self._chat
         chat.add_message("system", f"Switched to **{self.current_model}**")
 
     def action_toggle_hooks(self) -> None:
         """Toggle hook output visibility."""
         self.show_hooks = not self.show_hooks
-        chat = self.query_one("#chat-container", ChatContainer)
+        chat = self._chat
         state = "enabled" if self.show_hooks else "disabled"
         chat.add_message("system", f"Hook output **{state}**")
 
     def action_toggle_palette(self) -> None:
         """Toggle command palette visibility."""
-        palette = self.query_one("#command-palette", CommandPalette)
+        # The palette is populated once commands load; toggling only shows or hides it
         self.palette_visible = not self.palette_visible
-        if self.palette_visible:
-            palette.add_class("visible")
-            # Refresh with current commands
-            palette.remove_children()
-            palette.mount(Label("[bold]Available Commands[/bold]", classes="palette-header"))
-            options = []
-            for cmd in self.available_commands:
-                name = cmd.get("name", "")
-                desc = cmd.get("description", "")[:40]
-                options.append(Option(f"/{name} - {desc}"))
-            palette.mount(OptionList(*options, id="command-list"))
-        else:
-            palette.remove_class("visible")
+        self._palette.set_class(self.palette_visible, "visible")
 
     def action_complete(self) -> None:
         """Accept autocomplete suggestion."""
-        input_widget = self.query_one("#prompt-input", Input)
         # Textual's Input handles Tab for suggestion acceptance by default
         pass
 
+    def _start_disconnect(self) -> asyncio.Task[None] | None:
+        """Schedule the client disconnect once, returning the task."""
+        if self.client and self._disconnect_task is None:
+            self._disconnect_task = asyncio.create_task(self.client.disconnect())
+        return self._disconnect_task
+
     async def on_unmount(self) -> None:
-        """Clean up on exit."""
-        if self.client:
-            await self.client.disconnect()
+        """Clean up on exit, without letting a slow disconnect stall it."""
+        task = self._start_disconnect()
+        if task is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=DISCONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            # Don't leave the disconnect pending while the loop shuts down
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
+def _install_uvloop() -> None:
+    """Use uvloop for the event loop when it's installed (the ``fast`` extra)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main() -> None:
     """Entry point for cameron-code TUI."""
+    _install_uvloop()
     app = CameronCodeApp()
     app.run()
 
@@ -0,0 +1,31 @@
+"""Helpers shared by the live SDK tests."""
+
+import logging
+import re
+from collections.abc import AsyncIterable
+
+from claude_agent_sdk import AssistantMessage, ClaudeSDKClient, Message, ResultMessage, TextBlock
+
+
+log = logging.getLogger(__name__)
+
+# Words the /greet command's reply is expected to contain
+GREETING_RE = re.compile(r"cameron|custom|hello", re.IGNORECASE)
+
+
+async def collect(client: ClaudeSDKClient) -> tuple[str, ResultMessage | None]:
+    """Drain one response, keeping only the assistant text and the result."""
+    return await collect_stream(client.receive_response())
+
+
+async def collect_stream(messages: AsyncIterable[Message]) -> tuple[str, ResultMessage | None]:
+    """Single pass over a message stream, as collect() but for one-shot query() calls."""
+    text_parts: list[str] = []
+    result = None
+    async for msg in messages:
+        log.debug("Message type: %s", type(msg).__name__)
+        if isinstance(msg, AssistantMessage):
+            text_parts.extend(block.text for block in msg.content if isinstance(block, TextBlock))
+        elif isinstance(msg, ResultMessage):
+            result = msg
+    return "".join(text_parts), result
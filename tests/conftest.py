@@ -0,0 +1,48 @@
+"""Shared pytest configuration."""
+
+from pathlib import Path
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # the ``fast`` extra isn't installed, or on Windows
+    uvloop = None
+
+# Provider selection a developer's shell may export; unit tests start without them
+PROVIDER_ENV_VARS = (
+    "ANTHROPIC_BASE_URL",
+    "ANTHROPIC_MODEL",
+    "ANTHROPIC_AUTH_TOKEN",
+    "CLAUDE_CODE_USE_BEDROCK",
+    "CLAUDE_CODE_USE_VERTEX",
+)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it's installed, like the TUI does."""
+    if uvloop is None:
+        return None
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(autouse=True)
+def clean_provider_env(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unset provider env vars, except for live tests that need the real provider."""
+    if request.node.get_closest_marker("integration"):
+        return
+    for key in PROVIDER_ENV_VARS:
+        monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture(scope="session")
+def repo_root() -> str:
+    """This checkout, for live tests that read or list the repo's own files."""
+    return str(Path(__file__).resolve().parent.parent)
+
+
+@pytest.fixture(scope="session")
+def command_project() -> str:
+    """Minimal project whose only content is the greet and analyze slash commands."""
+    return str(Path(__file__).resolve().parent / "fixtures" / "project")
@@ -0,0 +1,334 @@
+"""Tests for CameronCodeClient internals that don't need a live session."""
+
+import asyncio
+import contextlib
+import dataclasses
+import inspect
+
+import pytest
+from claude_agent_sdk import (
+    AssistantMessage,
+    PermissionResultAllow,
+    PermissionResultDeny,
+    StreamEvent,
+    TextBlock,
+    ToolUseBlock,
+)
+
+from cameron_code.client import AuditEntry, CameronCodeClient, _dedupe_streamed_text
+
+PRE_TOOL_INPUT = {
+    "hook_event_name": "PreToolUse",
+    "tool_name": "Read",
+    "tool_input": {"file_path": "README.md"},
+}
+POST_TOOL_INPUT = {
+    **PRE_TOOL_INPUT,
+    "hook_event_name": "PostToolUse",
+    "tool_response": "# cameron-code",
+}
+
+
+def _permission_entry(tool_name: str) -> AuditEntry:
+    """Build a permission-check audit entry for seeding the log."""
+    return AuditEntry(event="permission_check", tool_name=tool_name, tool_input={})
+
+
+class TestAuditLog:
+    """Tests for audit log storage."""
+
+    def test_default_is_bounded(self) -> None:
+        """Verify the default audit log drops the oldest entries past capacity."""
+        client = CameronCodeClient(audit_log_capacity=3)
+        for i in range(5):
+            client.audit_log.append(_permission_entry(f"Tool{i}"))
+
+        log = client.get_audit_log()
+        assert [entry["tool"] for entry in log] == ["Tool2", "Tool3", "Tool4"]
+
+    def test_provided_list_receives_dicts(self) -> None:
+        """Verify a caller-provided list keeps receiving entries as dicts, unbounded."""
+        shared: list[dict] = []
+        client = CameronCodeClient(audit_log=shared, audit_log_capacity=1)
+        client._record_audit(_permission_entry("Read"))
+        client._record_audit(_permission_entry("Write"))
+
+        assert client.get_audit_log() == shared
+        assert [entry["tool"] for entry in shared] == ["Read", "Write"]
+
+    def test_get_audit_log_returns_copy(self) -> None:
+        """Verify mutating the returned log doesn't affect the client."""
+        client = CameronCodeClient()
+        client.audit_log.append(_permission_entry("Read"))
+
+        log = client.get_audit_log()
+        log.clear()
+        assert len(client.get_audit_log()) == 1
+
+    def test_iter_audit_log_is_a_snapshot(self) -> None:
+        """Verify entries added mid-iteration don't show up in the iterator."""
+        client = CameronCodeClient()
+        client.audit_log.append(_permission_entry("Read"))
+
+        entries = client.iter_audit_log()
+        client.audit_log.append(_permission_entry("Write"))
+        assert [entry["tool"] for entry in entries] == ["Read"]
+
+
+class TestAuditBatching:
+    """Tests for batched audit log writes."""
+
+    async def test_permission_check_is_recorded(self) -> None:
+        """Verify queued entries are visible through get_audit_log."""
+        client = CameronCodeClient()
+        await client._default_permission_callback("Read", {"file_path": "x"}, None)
+
+        log = client.get_audit_log()
+        assert log == [
+            {"event": "permission_check", "tool": "Read", "input": {"file_path": "x"}}
+        ]
+
+    async def test_disabled_audit_records_nothing(self) -> None:
+        """Verify hooks skip audit entries when auditing is turned off."""
+        client = CameronCodeClient(audit=False)
+        await client._default_permission_callback("Read", {}, None)
+        await client._pre_tool_hook(PRE_TOOL_INPUT, "tool-1", None)
+        assert client.get_audit_log() == []
+
+        client.enable_audit()
+        await client._pre_tool_hook(PRE_TOOL_INPUT, "tool-2", None)
+        assert len(client.get_audit_log()) == 1
+
+    async def test_hook_entries_capture_tool_details(self) -> None:
+        """Verify pre/post hook entries record tool name, input and output."""
+        client = CameronCodeClient()
+        await client._pre_tool_hook(PRE_TOOL_INPUT, "tool-1", None)
+        await client._post_tool_hook(POST_TOOL_INPUT, "tool-1", None)
+
+        pre, post = client.get_audit_log()
+        assert pre["tool_input"] == {"file_path": "README.md"}
+        assert post["tool_name"] == "Read"
+        assert post["tool_output"] == "# cameron-code"
+
+    async def test_flush_loop_drains_in_batches(self) -> None:
+        """Verify the background flush task moves entries into the log."""
+        client = CameronCodeClient(audit_batch_size=2, audit_flush_interval=0)
+        task = asyncio.create_task(client._audit_flush_loop())
+        for i in range(3):
+            client._record_audit(_permission_entry(f"Tool{i}"))
+
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        assert [entry.tool_name for entry in client.audit_log] == ["Tool0", "Tool1", "Tool2"]
+
+    async def test_read_mid_interval_is_complete_and_ordered(self) -> None:
+        """Verify reading while the flush task holds a batch keeps every entry in order."""
+        client = CameronCodeClient(audit_flush_interval=60)
+        task = asyncio.create_task(client._audit_flush_loop())
+        for i in range(3):
+            client._record_audit(_permission_entry(f"T{i}"))
+        # Let the flush task pick up T0 and start sleeping on it
+        await asyncio.sleep(0)
+
+        assert [entry["tool"] for entry in client.get_audit_log()] == ["T0", "T1", "T2"]
+
+        client._record_audit(_permission_entry("T3"))
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        assert [entry["tool"] for entry in client.get_audit_log()] == ["T0", "T1", "T2", "T3"]
+
+    async def test_exit_flushes_when_sdk_exit_fails(self) -> None:
+        """Verify a failing SDK exit still stops the flush task and keeps queued entries."""
+
+        class FailingSDKClient:
+            async def __aexit__(self, *exc_info) -> None:
+                raise RuntimeError("transport closed")
+
+        client = CameronCodeClient(audit_flush_interval=60)
+        client._client = FailingSDKClient()
+        client._audit_task = task = asyncio.create_task(client._audit_flush_loop())
+        client._record_audit(_permission_entry("Read"))
+
+        with pytest.raises(RuntimeError, match="transport closed"):
+            await client.__aexit__(None, None, None)
+
+        assert task.done()
+        assert client._client is None
+        assert [entry.tool_name for entry in client.audit_log] == ["Read"]
+
+
+class TestBuildOptions:
+    """Tests for options construction."""
+
+    def test_options_are_reused(self) -> None:
+        """Verify repeated builds return the cached options."""
+        client = CameronCodeClient(cwd="/test")
+        assert client._build_options() is client._build_options()
+
+    def test_options_rebuilt_on_config_change(self) -> None:
+        """Verify changing cwd or allowed tools invalidates the cache."""
+        client = CameronCodeClient(cwd="/test", allowed_tools=["Read"])
+        first = client._build_options()
+
+        client.allowed_tools.append("Write")
+        second = client._build_options()
+        assert second is not first
+        assert second.allowed_tools == ["Read", "Write"]
+
+        client.cwd = "/other"
+        assert client._build_options().cwd == "/other"
+
+
+class TestDefaultPermissions:
+    """Tests for the built-in permission callback."""
+
+    async def test_blocks_dangerous_bash(self) -> None:
+        """Verify known-dangerous commands are denied with the matched pattern."""
+        client = CameronCodeClient()
+        result = await client._default_permission_callback(
+            "Bash", {"command": "sudo mkfs.ext4 /dev/sdb1"}, None
+        )
+
+        assert isinstance(result, PermissionResultDeny)
+        assert result.message.endswith("mkfs")
+
+    async def test_allows_safe_bash(self) -> None:
+        """Verify ordinary commands are allowed."""
+        client = CameronCodeClient()
+        result = await client._default_permission_callback(
+            "Bash", {"command": "ls -la"}, None
+        )
+
+        assert isinstance(result, PermissionResultAllow)
+
+    async def test_custom_callback_still_sees_fast_path_tools(self) -> None:
+        """Verify read-only tools reach a custom callback when one is set."""
+        seen: list[str] = []
+
+        async def deny_all(tool_name, tool_input, context):
+            seen.append(tool_name)
+            return PermissionResultDeny(message="no")
+
+        client = CameronCodeClient(permission_callback=deny_all)
+        result = await client._default_permission_callback("Read", {}, None)
+
+        assert isinstance(result, PermissionResultDeny)
+        assert seen == ["Read"]
+        assert client.get_audit_log()[0]["tool"] == "Read"
+
+
+class TestStreamPartials:
+    """Tests for partial message streaming."""
+
+    def test_partials_enabled_by_default(self) -> None:
+        """Verify options request partial messages unless opted out."""
+        assert CameronCodeClient()._build_options().include_partial_messages is True
+        client = CameronCodeClient(stream_partials=False)
+        assert client._build_options().include_partial_messages is False
+
+    async def test_streamed_text_not_repeated(self) -> None:
+        """Verify consolidated messages drop text already sent as deltas."""
+        delta = StreamEvent(
+            uuid="1",
+            session_id="s",
+            event={"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hi"}},
+        )
+        tool_use = ToolUseBlock(id="t1", name="Read", input={})
+        final = AssistantMessage(content=[TextBlock(text="Hi"), tool_use], model="m")
+        unstreamed = AssistantMessage(content=[TextBlock(text="Bye")], model="m")
+
+        async def source():
+            for message in (delta, final, unstreamed):
+                yield message
+
+        received = [m async for m in _dedupe_streamed_text(source())]
+
+        assert received[0] is delta
+        assert received[1].content == [tool_use]
+        assert received[2] is unstreamed
+
+    async def test_only_streamed_blocks_are_stripped(self) -> None:
+        """Verify text that never arrived as a delta, or came from a subagent, is kept."""
+        subagent_delta = StreamEvent(
+            uuid="1",
+            session_id="s",
+            event={"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hi"}},
+            parent_tool_use_id="task-1",
+        )
+        main = AssistantMessage(content=[TextBlock(text="Hi")], model="m")
+        delta = dataclasses.replace(subagent_delta, parent_tool_use_id=None)
+        mixed = AssistantMessage(content=[TextBlock(text="Hi"), TextBlock(text="Bye")], model="m")
+
+        async def source():
+            for message in (subagent_delta, main, delta, mixed):
+                yield message
+
+        received = [m async for m in _dedupe_streamed_text(source())]
+
+        assert received[1] is main
+        assert received[3].content == [TextBlock(text="Bye")]
+
+    async def test_blocks_match_exact_streamed_text(self) -> None:
+        """Verify short blocks survive when they only appear inside longer streamed text."""
+
+        def delta(index: int, text: str) -> StreamEvent:
+            event = {
+                "type": "content_block_delta",
+                "index": index,
+                "delta": {"type": "text_delta", "text": text},
+            }
+            return StreamEvent(uuid=str(index), session_id="s", event=event)
+
+        first = AssistantMessage(content=[TextBlock(text="All Done. Next")], model="m")
+        second = AssistantMessage(content=[TextBlock(text="Reading")], model="m")
+        short = AssistantMessage(content=[TextBlock(text="Done.")], model="m")
+
+        async def source():
+            for message in (delta(0, "All Done."), delta(0, " Next"), delta(1, "Reading")):
+                yield message
+            for message in (first, second, short):
+                yield message
+
+        received = [m async for m in _dedupe_streamed_text(source())]
+
+        assert received[3].content == []
+        assert received[4].content == []
+        assert received[5] is short
+
+
+class TestConnectionGuards:
+    """Tests for methods that need an active session."""
+
+    def test_receive_requires_session(self) -> None:
+        """Verify receiving before entering the context fails immediately."""
+        client = CameronCodeClient()
+        with pytest.raises(RuntimeError, match="Client not initialized"):
+            client.receive_response()
+        with pytest.raises(RuntimeError, match="Client not initialized"):
+            client.receive_messages()
+
+    async def test_session_methods_require_session(self) -> None:
+        """Verify async session methods fail before the context is entered."""
+        client = CameronCodeClient()
+        for call in (client.connect, lambda: client.query("hi"), client.get_server_info):
+            with pytest.raises(RuntimeError, match="Client not initialized"):
+                await call()
+
+    async def test_async_methods_stay_coroutine_functions(self) -> None:
+        """Verify guarded async methods are still coroutine functions that fail on await."""
+        for method in (
+            CameronCodeClient.connect,
+            CameronCodeClient.query,
+            CameronCodeClient.get_server_info,
+        ):
+            assert inspect.iscoroutinefunction(method)
+
+        # Creating the coroutine doesn't raise; awaiting it does
+        pending = CameronCodeClient().query("hi")
+        with pytest.raises(RuntimeError, match="Client not initialized"):
+            await pending
@@ -1,18 +1,24 @@
 """Test hooks (PreToolUse, PostToolUse) work through the SDK."""
 
+import logging
+
 import pytest
 from claude_agent_sdk import (
     ClaudeSDKClient,
     ClaudeAgentOptions,
     HookMatcher,
-    AssistantMessage,
-    ResultMessage,
     PreToolUseHookInput,
     PostToolUseHookInput,
 )
 
+from ._sdk_helpers import collect
+
+
+log = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.integration
+
 
-@pytest.mark.asyncio
 async def test_pre_tool_hook_logging():
     """Verify PreToolUse hook is called before tool execution."""
     hook_calls: list[dict] = []
@@ -40,17 +46,14 @@ async def test_pre_tool_hook_logging():
 
     async with ClaudeSDKClient(options) as client:
         await client.query("Run: echo 'testing hooks'")
-        async for msg in client.receive_response():
-            if isinstance(msg, AssistantMessage):
-                print(f"Assistant: {msg}")
+        await collect(client)
 
     # Hook should have been called
     assert len(hook_calls) > 0
     assert hook_calls[0]["event"] == "pre"
-    print(f"Pre-hook calls: {hook_calls}")
+    log.debug("Pre-hook calls: %s", hook_calls)
 
 
-@pytest.mark.asyncio
 async def test_post_tool_hook_logging():
     """Verify PostToolUse hook is called after tool execution."""
     hook_calls: list[dict] = []
@@ -78,16 +81,14 @@ async def test_post_tool_hook_logging():
 
     async with ClaudeSDKClient(options) as client:
         await client.query("Run: echo 'post hook test'")
-        async for msg in client.receive_response():
-            pass
+        await collect(client)
 
     # Hook should have been called
     assert len(hook_calls) > 0
     assert hook_calls[0]["event"] == "post"
-    print(f"Post-hook calls: {hook_calls}")
+    log.debug("Post-hook calls: %s", hook_calls)
 
 
-@pytest.mark.asyncio
 async def test_pre_hook_can_block_tool():
     """Verify PreToolUse hook can block tool execution."""
     blocked = []
@@ -119,12 +120,10 @@ async def test_pre_hook_can_block_tool():
         max_turns=3,
     )
 
-    messages = []
     async with ClaudeSDKClient(options) as client:
         await client.query("Run this command: echo 'forbidden command'")
-        async for msg in client.receive_response():
-            messages.append(msg)
+        await collect(client)
 
     # The command should have been blocked
     assert len(blocked) > 0
-    print(f"Blocked commands: {blocked}")
+    log.debug("Blocked commands: %s", blocked)
@@ -1,18 +1,25 @@
 """Test custom MCP tools work through the SDK."""
 
+import re
+
 import pytest
 from claude_agent_sdk import (
     ClaudeSDKClient,
     ClaudeAgentOptions,
     create_sdk_mcp_server,
-    AssistantMessage,
-    ResultMessage,
 )
 
 from cameron_code.tools import cameron_search, cameron_time
 
+from ._sdk_helpers import collect
+
+
+pytestmark = pytest.mark.integration
+
+# The cameron_search result for "coffee" is an oat milk latte
+LATTE_RE = re.compile(r"oat milk|latte", re.IGNORECASE)
+
 
-@pytest.mark.asyncio
 async def test_custom_mcp_tool_search():
     """Verify custom MCP tool cameron_search works."""
     server = create_sdk_mcp_server(
@@ -26,34 +33,20 @@ async def test_custom_mcp_tool_search():
         permission_mode="bypassPermissions",  # Auto-allow tools for testing
     )
 
-    messages = []
     async with ClaudeSDKClient(options) as client:
         # Use query() to send message after auto-connect
         await client.query(
             "Use the cameron_search tool to search for 'coffee'. Report what you find."
         )
-        async for msg in client.receive_response():
-            messages.append(msg)
-            if isinstance(msg, AssistantMessage):
-                print(f"Assistant: {msg}")
+        assistant_content, result = await collect(client)
 
     # Should complete
-    result = next((m for m in messages if isinstance(m, ResultMessage)), None)
     assert result is not None
 
-    # The response should mention something about coffee/lattes
-    assistant_content = ""
-    for msg in messages:
-        if isinstance(msg, AssistantMessage):
-            for block in msg.content:
-                if hasattr(block, "text"):
-                    assistant_content += block.text
-
     # Should have used the tool and gotten a result
-    assert "oat milk" in assistant_content.lower() or "latte" in assistant_content.lower()
+    assert LATTE_RE.search(assistant_content)
 
 
-@pytest.mark.asyncio
 async def test_custom_mcp_tool_time():
     """Verify custom MCP tool cameron_time works."""
     server = create_sdk_mcp_server(
@@ -67,11 +60,8 @@ async def test_custom_mcp_tool_time():
         permission_mode="bypassPermissions",  # Auto-allow tools for testing
     )
 
-    messages = []
     async with ClaudeSDKClient(options) as client:
         await client.query("Use the cameron_time tool to get the current time.")
-        async for msg in client.receive_response():
-            messages.append(msg)
+        _, result = await collect(client)
 
-    result = next((m for m in messages if isinstance(m, ResultMessage)), None)
     assert result is not None
@@ -1,19 +1,25 @@
 """Test permission callbacks work through the SDK."""
 
+import logging
+
 import pytest
 from claude_agent_sdk import (
     ClaudeSDKClient,
     ClaudeAgentOptions,
-    AssistantMessage,
-    ResultMessage,
     PermissionResult,
     PermissionResultAllow,
     PermissionResultDeny,
 )
 
+from ._sdk_helpers import collect
+
+
+log = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.integration
+
 
-@pytest.mark.asyncio
-async def test_permission_callback_allow():
+async def test_permission_callback_allow(repo_root: str):
     """Verify permission callback can allow tool execution."""
     permission_checks: list[dict] = []
 
@@ -34,7 +40,7 @@ async def test_permission_callback_allow():
     options = ClaudeAgentOptions(
         can_use_tool=allow_callback,
         max_turns=3,
-        cwd="/Users/cameron/Projects/cameron-code-test",
+        cwd=repo_root,
         # Use default permission mode so callback is invoked
         permission_mode="default",
     )
@@ -44,17 +50,14 @@ async def test_permission_callback_allow():
         await client.query(
             "Create a file called /tmp/cameron_test_permission.txt with content 'hello'"
         )
-        async for msg in client.receive_response():
-            if isinstance(msg, AssistantMessage):
-                print(f"Assistant: {msg}")
+        await collect(client)
 
     # Permission callback should have been invoked for Write
     assert len(permission_checks) > 0
-    print(f"Permission checks: {permission_checks}")
+    log.debug("Permission checks: %s", permission_checks)
 
 
-@pytest.mark.asyncio
-async def test_permission_callback_deny():
+async def test_permission_callback_deny(repo_root: str):
     """Verify permission callback can deny tool execution."""
     permission_checks: list[dict] = []
 
@@ -87,26 +90,23 @@ async def test_permission_callback_deny():
     options = ClaudeAgentOptions(
         can_use_tool=deny_write_callback,
         max_turns=3,
-        cwd="/Users/cameron/Projects/cameron-code-test",
+        cwd=repo_root,
         permission_mode="default",
     )
 
-    messages = []
     async with ClaudeSDKClient(options) as client:
         await client.query(
             "Create a file called /tmp/cameron_deny_test.txt with content 'test'"
         )
-        async for msg in client.receive_response():
-            messages.append(msg)
+        await collect(client)
 
     # Should have denied the Write
     denied = [c for c in permission_checks if c.get("decision") == "deny"]
     assert len(denied) > 0
-    print(f"Denied operations: {denied}")
+    log.debug("Denied operations: %s", denied)
 
 
-@pytest.mark.asyncio
-async def test_permission_callback_selective():
+async def test_permission_callback_selective(repo_root: str):
     """Verify permission callback can selectively control different tools."""
     tool_decisions: list[dict] = []
 
@@ -133,21 +133,20 @@ async def test_permission_callback_selective():
     options = ClaudeAgentOptions(
         can_use_tool=selective_callback,
         max_turns=5,
-        cwd="/Users/cameron/Projects/cameron-code-test",
+        cwd=repo_root,
     )
 
     async with ClaudeSDKClient(options) as client:
         await client.query(
             "First read tests/test_permissions.py, then try to create a new file called test_output.txt with 'hello'"
         )
-        async for msg in client.receive_response():
-            pass
+        await collect(client)
 
     # Should have allowed Read, denied Write
     read_decisions = [d for d in tool_decisions if d["tool"] == "Read"]
     write_decisions = [d for d in tool_decisions if d["tool"] == "Write"]
 
-    print(f"Tool decisions: {tool_decisions}")
+    log.debug("Tool decisions: %s", tool_decisions)
 
     # Read should be allowed
     if read_decisions:
@@ -1,6 +1,8 @@
 """Tests for provider configuration utilities."""
 
-import os
+import dataclasses
+import subprocess
+import sys
 import pytest
 from claude_agent_sdk import ClaudeAgentOptions
 
@@ -16,40 +18,74 @@ from cameron_code.providers import (
     get_current_provider_info,
 )
 
+# (provider, api_key, model, env it must produce), shared by apply and create tests
+PROVIDER_ENV_CASES = [
+    (
+        "deepseek",
+        "sk-test",
+        None,
+        {
+            "ANTHROPIC_BASE_URL": "https://api.deepseek.com/anthropic",
+            "ANTHROPIC_AUTH_TOKEN": "sk-test",
+            "ANTHROPIC_MODEL": "deepseek-chat",
+        },
+    ),
+    ("deepseek", None, "deepseek-coder", {"ANTHROPIC_MODEL": "deepseek-coder"}),
+    (
+        "glm",
+        "glm-key",
+        None,
+        {
+            "ANTHROPIC_BASE_URL": "https://api.z.ai/api/anthropic",
+            "ANTHROPIC_AUTH_TOKEN": "glm-key",
+            "ANTHROPIC_MODEL": "glm-4.5-air",
+        },
+    ),
+    ("bedrock", None, None, {"CLAUDE_CODE_USE_BEDROCK": "1"}),
+]
+
+
+def assert_env_subset(actual: dict, expected: dict) -> None:
+    """Assert every expected env var is set to its value, reporting all mismatches at once."""
+    assert expected.items() <= actual.items(), (
+        f"missing/wrong: {set(expected.items()) - set(actual.items())}"
+    )
+
 
 class TestProviderRegistry:
     """Tests for provider registry."""
 
-    def test_has_official_providers(self) -> None:
-        """Verify official providers are registered."""
-        assert "anthropic" in PROVIDERS
-        assert "bedrock" in PROVIDERS
-        assert "vertex" in PROVIDERS
-
-        assert PROVIDERS["anthropic"].official is True
-        assert PROVIDERS["bedrock"].official is True
-        assert PROVIDERS["vertex"].official is True
-
-    def test_has_community_providers(self) -> None:
-        """Verify community providers are registered."""
-        assert "deepseek" in PROVIDERS
-        assert "deepseek-reasoner" in PROVIDERS
-        assert "glm" in PROVIDERS
-
-        assert PROVIDERS["deepseek"].official is False
-        assert PROVIDERS["glm"].official is False
+    @pytest.mark.parametrize(
+        "name,base_url,default_model,official",
+        [
+            ("anthropic", None, None, True),
+            ("bedrock", None, None, True),
+            ("vertex", None, None, True),
+            ("deepseek", "https://api.deepseek.com/anthropic", "deepseek-chat", False),
+            ("deepseek-reasoner", "https://api.deepseek.com/anthropic", "deepseek-reasoner", False),
+            ("glm", "https://api.z.ai/api/anthropic", "glm-4.5-air", False),
+        ],
+    )
+    def test_registered_provider(
+        self, name: str, base_url: str | None, default_model: str | None, official: bool
+    ) -> None:
+        """Verify each built-in provider is registered with the right configuration."""
+        provider = PROVIDERS[name]
+        assert (provider.base_url, provider.default_model, provider.official) == (
+            base_url,
+            default_model,
+            official,
+        )
 
-    def test_deepseek_has_correct_base_url(self) -> None:
-        """Verify DeepSeek provider has correct configuration."""
-        deepseek = PROVIDERS["deepseek"]
-        assert deepseek.base_url == "https://api.deepseek.com/anthropic"
-        assert deepseek.default_model == "deepseek-chat"
+    def test_registry_is_read_only(self) -> None:
+        """Verify the provider registry can't be mutated."""
+        with pytest.raises(TypeError):
+            PROVIDERS["new"] = PROVIDERS["anthropic"]  # type: ignore[index]
 
-    def test_glm_has_correct_base_url(self) -> None:
-        """Verify GLM provider has correct configuration."""
-        glm = PROVIDERS["glm"]
-        assert glm.base_url == "https://api.z.ai/api/anthropic"
-        assert glm.default_model == "glm-4.5-air"
+    def test_configs_are_frozen(self) -> None:
+        """Verify provider configs can't be modified in place."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            PROVIDERS["deepseek"].base_url = "http://localhost"  # type: ignore[misc]
 
 
 class TestGetProvider:
@@ -133,35 +169,27 @@ class TestApplyProviderConfig:
         assert result.cwd == "/test"
         assert result.max_turns == 5
 
-    def test_apply_deepseek(self) -> None:
-        """Test applying deepseek provider config."""
-        base = ClaudeAgentOptions(cwd="/test")
-        result = apply_provider_config(base, "deepseek", api_key="sk-test")
-
-        assert result.env is not None
-        assert result.env["ANTHROPIC_BASE_URL"] == "https://api.deepseek.com/anthropic"
-        assert result.env["ANTHROPIC_AUTH_TOKEN"] == "sk-test"
-        assert result.env["ANTHROPIC_MODEL"] == "deepseek-chat"
-
-    def test_apply_with_model_override(self) -> None:
-        """Test applying config with model override."""
-        base = ClaudeAgentOptions()
+    @pytest.mark.parametrize("provider,api_key,model,expected_env", PROVIDER_ENV_CASES)
+    def test_apply_sets_env(
+        self, provider: str, api_key: str | None, model: str | None, expected_env: dict
+    ) -> None:
+        """Test applying a provider config sets its environment variables."""
         result = apply_provider_config(
-            base,
-            "deepseek",
-            model_override="deepseek-coder",
+            ClaudeAgentOptions(cwd="/test"), provider, api_key=api_key, model_override=model
         )
 
         assert result.env is not None
-        assert result.env["ANTHROPIC_MODEL"] == "deepseek-coder"
+        assert_env_subset(result.env, expected_env)
 
-    def test_apply_bedrock(self) -> None:
-        """Test applying bedrock provider config."""
-        base = ClaudeAgentOptions()
-        result = apply_provider_config(base, "bedrock")
+    def test_apply_preserves_other_options(self) -> None:
+        """Test applying config keeps every option other than env."""
+        base = ClaudeAgentOptions(system_prompt="Be brief", max_budget_usd=1.5)
+        result = apply_provider_config(base, "deepseek")
 
-        assert result.env is not None
-        assert result.env["CLAUDE_CODE_USE_BEDROCK"] == "1"
+        assert result is not base
+        assert result.system_prompt == "Be brief"
+        assert result.max_budget_usd == 1.5
+        assert "ANTHROPIC_BASE_URL" not in (base.env or {})
 
     def test_apply_invalid_provider(self) -> None:
         """Test applying config for invalid provider raises error."""
@@ -185,28 +213,15 @@ class TestCreateOptionsForProvider:
         assert options.max_turns == 10
         assert options.setting_sources == ["project"]
 
-    def test_create_for_deepseek(self) -> None:
-        """Test creating options for deepseek provider."""
-        options = create_options_for_provider(
-            "deepseek",
-            api_key="sk-xxx",
-            cwd="/test",
-        )
-
-        assert options.env is not None
-        assert options.env["ANTHROPIC_BASE_URL"] == "https://api.deepseek.com/anthropic"
-        assert options.env["ANTHROPIC_AUTH_TOKEN"] == "sk-xxx"
-
-    def test_create_for_glm(self) -> None:
-        """Test creating options for GLM provider."""
-        options = create_options_for_provider(
-            "glm",
-            api_key="glm-key",
-        )
+    @pytest.mark.parametrize("provider,api_key,model,expected_env", PROVIDER_ENV_CASES)
+    def test_create_sets_env(
+        self, provider: str, api_key: str | None, model: str | None, expected_env: dict
+    ) -> None:
+        """Test creating options for a provider sets the same env as applying it."""
+        options = create_options_for_provider(provider, api_key=api_key, model=model, cwd="/test")
 
         assert options.env is not None
-        assert options.env["ANTHROPIC_BASE_URL"] == "https://api.z.ai/api/anthropic"
-        assert options.env["ANTHROPIC_MODEL"] == "glm-4.5-air"
+        assert_env_subset(options.env, expected_env)
 
     def test_create_invalid_provider(self) -> None:
         """Test creating options for invalid provider raises error."""
@@ -217,24 +232,30 @@ class TestCreateOptionsForProvider:
 class TestGetProviderEnvExample:
     """Tests for get_provider_env_example function."""
 
-    def test_anthropic_example(self) -> None:
-        """Test env example for anthropic."""
-        example = get_provider_env_example("anthropic")
-        assert "# Anthropic configuration" in example
-        assert "ANTHROPIC_AUTH_TOKEN" in example
-
-    def test_deepseek_example(self) -> None:
-        """Test env example for deepseek."""
-        example = get_provider_env_example("deepseek")
-        assert "# DeepSeek configuration" in example
-        assert "ANTHROPIC_BASE_URL" in example
-        assert "api.deepseek.com" in example
-        assert "deepseek-chat" in example
-
-    def test_bedrock_example(self) -> None:
-        """Test env example for bedrock."""
-        example = get_provider_env_example("bedrock")
-        assert "CLAUDE_CODE_USE_BEDROCK" in example
+    @pytest.mark.parametrize(
+        "provider,expected",
+        [
+            ("anthropic", ("# Anthropic configuration", "ANTHROPIC_AUTH_TOKEN")),
+            (
+                "deepseek",
+                (
+                    "# DeepSeek configuration",
+                    "ANTHROPIC_BASE_URL",
+                    "api.deepseek.com",
+                    "deepseek-chat",
+                ),
+            ),
+            ("bedrock", ("CLAUDE_CODE_USE_BEDROCK",)),
+        ],
+    )
+    def test_example_mentions(self, provider: str, expected: tuple[str, ...]) -> None:
+        """Test each provider's env example names its settings."""
+        example = get_provider_env_example(provider)
+        assert [text for text in expected if text not in example] == []
+
+    def test_repeated_calls_are_cached(self) -> None:
+        """Test the same provider returns the identical cached string."""
+        assert get_provider_env_example("glm") is get_provider_env_example("glm")
 
     def test_invalid_provider(self) -> None:
         """Test env example for invalid provider raises error."""
@@ -245,56 +266,52 @@ class TestGetProviderEnvExample:
 class TestGetCurrentProviderInfo:
     """Tests for get_current_provider_info function."""
 
-    def test_default_is_anthropic(self) -> None:
-        """Test default provider is anthropic when no env vars set."""
-        # Clear relevant env vars
-        env_backup = {}
-        for key in ["ANTHROPIC_BASE_URL", "ANTHROPIC_MODEL", "CLAUDE_CODE_USE_BEDROCK", "CLAUDE_CODE_USE_VERTEX"]:
-            env_backup[key] = os.environ.pop(key, None)
-
-        try:
-            info = get_current_provider_info()
-            assert info["name"] == "anthropic"
-            assert info["official"] is True
-        finally:
-            # Restore env vars
-            for key, value in env_backup.items():
-                if value is not None:
-                    os.environ[key] = value
-
-    def test_detects_deepseek_from_base_url(self) -> None:
-        """Test detection of deepseek from base URL."""
-        env_backup = {
-            "ANTHROPIC_BASE_URL": os.environ.get("ANTHROPIC_BASE_URL"),
-            "CLAUDE_CODE_USE_BEDROCK": os.environ.pop("CLAUDE_CODE_USE_BEDROCK", None),
-            "CLAUDE_CODE_USE_VERTEX": os.environ.pop("CLAUDE_CODE_USE_VERTEX", None),
-        }
-
-        try:
-            os.environ["ANTHROPIC_BASE_URL"] = "https://api.deepseek.com/anthropic"
-            info = get_current_provider_info()
-            assert info["name"] == "deepseek"
-            assert info["official"] is False
-        finally:
-            if env_backup["ANTHROPIC_BASE_URL"]:
-                os.environ["ANTHROPIC_BASE_URL"] = env_backup["ANTHROPIC_BASE_URL"]
-            else:
-                os.environ.pop("ANTHROPIC_BASE_URL", None)
-            for key in ["CLAUDE_CODE_USE_BEDROCK", "CLAUDE_CODE_USE_VERTEX"]:
-                if env_backup.get(key):
-                    os.environ[key] = env_backup[key]
-
-    def test_detects_bedrock(self) -> None:
-        """Test detection of bedrock provider."""
-        env_backup = os.environ.get("CLAUDE_CODE_USE_BEDROCK")
-
-        try:
-            os.environ["CLAUDE_CODE_USE_BEDROCK"] = "1"
-            info = get_current_provider_info()
-            assert info["name"] == "bedrock"
-            assert info["official"] is True
-        finally:
-            if env_backup:
-                os.environ["CLAUDE_CODE_USE_BEDROCK"] = env_backup
-            else:
-                os.environ.pop("CLAUDE_CODE_USE_BEDROCK", None)
+    @pytest.mark.parametrize(
+        "env,expected_name,expected_official",
+        [
+            ({}, "anthropic", True),
+            ({"ANTHROPIC_BASE_URL": "https://api.deepseek.com/anthropic"}, "deepseek", False),
+            # Matched on the base URL host, regardless of case or path
+            ({"ANTHROPIC_BASE_URL": "https://API.Z.AI/api/anthropic/v2"}, "glm", False),
+            ({"ANTHROPIC_BASE_URL": "http://localhost:4000"}, "custom", False),
+            ({"CLAUDE_CODE_USE_BEDROCK": "1"}, "bedrock", True),
+        ],
+    )
+    def test_detects_provider_from_env(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        env: dict[str, str],
+        expected_name: str,
+        expected_official: bool,
+    ) -> None:
+        """Test the active provider is detected from environment variables."""
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        info = get_current_provider_info()
+        assert info["name"] == expected_name
+        assert info["official"] is expected_official
+
+    def test_result_is_a_fresh_copy(self) -> None:
+        """Test mutating a returned dict doesn't leak into later calls."""
+        info = get_current_provider_info()
+        name = info["name"]
+        info["name"] = "mutated"
+
+        assert get_current_provider_info()["name"] == name
+
+
+class TestLazySdkImport:
+    """Tests for keeping the SDK out of provider-only imports."""
+
+    def test_catalog_import_skips_sdk(self) -> None:
+        """Test importing provider helpers doesn't load claude_agent_sdk."""
+        code = (
+            "import sys\n"
+            "from cameron_code import get_provider, list_providers\n"
+            "assert get_provider('glm') is not None\n"
+            "assert 'claude_agent_sdk' not in sys.modules\n"
+            "from cameron_code import CameronCodeClient\n"
+            "assert 'claude_agent_sdk' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
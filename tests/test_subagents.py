@@ -1,22 +1,26 @@
 """Test that subagents (Task tool) work through the SDK."""
 
+import logging
+
 import pytest
 from claude_agent_sdk import (
     ClaudeSDKClient,
     ClaudeAgentOptions,
-    AssistantMessage,
-    ResultMessage,
 )
 
+from ._sdk_helpers import collect
 
-@pytest.mark.asyncio
-async def test_task_tool_subagent():
-    """Verify Task tool can spawn subagents."""
-    messages = []
 
+log = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.integration
+
+
+async def test_task_tool_subagent(repo_root: str):
+    """Verify Task tool can spawn subagents."""
     options = ClaudeAgentOptions(
         max_turns=10,  # Subagents need more turns
-        cwd="/Users/cameron/Projects/cameron-code-test",
+        cwd=repo_root,
         allowed_tools=["Task", "Read", "Glob", "Grep"],  # Enable Task tool
     )
 
@@ -25,25 +29,18 @@ async def test_task_tool_subagent():
             "Use the Task tool with subagent_type='Explore' to find what Python files exist in src/. "
             "Just report the file names."
         )
-        async for msg in client.receive_response():
-            messages.append(msg)
-            if isinstance(msg, AssistantMessage):
-                print(f"Assistant message received")
+        _, result = await collect(client)
 
     # Should complete
-    result = next((m for m in messages if isinstance(m, ResultMessage)), None)
     assert result is not None
-    print(f"Result: {result}")
+    log.debug("Result: %s", result)
 
 
-@pytest.mark.asyncio
-async def test_subagent_explore_codebase():
+async def test_subagent_explore_codebase(repo_root: str):
     """Verify Explore subagent can analyze codebase structure."""
-    messages = []
-
     options = ClaudeAgentOptions(
         max_turns=15,
-        cwd="/Users/cameron/Projects/cameron-code-test",
+        cwd=repo_root,
     )
 
     async with ClaudeSDKClient(options) as client:
@@ -51,12 +48,9 @@ async def test_subagent_explore_codebase():
             "Use the Task tool with subagent_type='Explore' and a prompt asking it to "
             "describe the structure of this project. Keep it brief."
         )
-        async for msg in client.receive_response():
-            messages.append(msg)
+        assistant_content, result = await collect(client)
 
-    result = next((m for m in messages if isinstance(m, ResultMessage)), None)
     assert result is not None
 
     # Check we got substantive response
-    assistant_msgs = [m for m in messages if isinstance(m, AssistantMessage)]
-    assert len(assistant_msgs) > 0
+    assert assistant_content
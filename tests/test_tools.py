@@ -0,0 +1,43 @@
+"""Tests for custom MCP tool handlers, called directly without the SDK."""
+
+from datetime import datetime
+
+from cameron_code.tools import cameron_search, cameron_time
+
+
+def _text(result: dict) -> str:
+    """Extract the text payload from a tool result."""
+    return result["content"][0]["text"]
+
+
+class TestCameronSearch:
+    """Tests for the cameron_search tool."""
+
+    async def test_matches_value(self) -> None:
+        """Verify queries match knowledge base values case-insensitively."""
+        text = _text(await cameron_search.handler({"query": "OAT MILK"}))
+        assert text == "Cameron prefers oat milk lattes."
+
+    async def test_matches_key(self) -> None:
+        """Verify queries match knowledge base keys."""
+        text = _text(await cameron_search.handler({"query": "favorite_color"}))
+        assert "blue" in text
+
+    async def test_no_results(self) -> None:
+        """Verify a miss reports that nothing was found."""
+        text = _text(await cameron_search.handler({"query": "tea"}))
+        assert text == "No results found for 'tea' in Cameron's knowledge base."
+
+
+class TestCameronTime:
+    """Tests for the cameron_time tool."""
+
+    async def test_returns_utc_timestamp(self) -> None:
+        """Verify the tool returns a parseable UTC ISO timestamp."""
+        text = _text(await cameron_time.handler({}))
+        prefix = "Current UTC time: "
+
+        assert text.startswith(prefix)
+        parsed = datetime.fromisoformat(text[len(prefix):])
+        assert parsed.utcoffset() is not None
+        assert parsed.utcoffset().total_seconds() == 0
@@ -0,0 +1,611 @@
+"""Tests for TUI widgets, run headless without an SDK session."""
+
+import asyncio
+import contextlib
+
+import pytest
+from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock, ToolUseBlock
+from textual.app import App, ComposeResult
+from textual.geometry import Region
+from textual.widgets import Markdown, OptionList, Static
+
+from cameron_code import tui
+from cameron_code.tui import (
+    TOOL_VERBS,
+    CameronCodeApp,
+    ChatContainer,
+    MessageDisplay,
+    SlashCommandSuggester,
+    ThinkingIndicator,
+    _batched,
+    _content_widget,
+    _hook_preview,
+    _markdown_parser,
+)
+
+
+class ChatApp(App):
+    """Minimal app hosting a single ChatContainer."""
+
+    def __init__(self, **chat_kwargs) -> None:
+        super().__init__()
+        self._chat_kwargs = chat_kwargs
+
+    def compose(self) -> ComposeResult:
+        yield ChatContainer(**self._chat_kwargs)
+
+
+class ScriptedClient:
+    """Stand-in SDK client that replays a fixed list of messages."""
+
+    def __init__(self, options) -> None:
+        self.messages: list = []
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def get_server_info(self) -> dict:
+        return {"commands": [{"name": "greet", "description": "Say hi"}]}
+
+    async def query(self, prompt: str) -> None:
+        pass
+
+    async def set_model(self, model: str) -> None:
+        pass
+
+    async def interrupt(self) -> None:
+        pass
+
+    async def receive_response(self):
+        for message in self.messages:
+            yield message
+
+
+class InterruptibleClient(ScriptedClient):
+    """Client whose reply stalls after its first text until interrupted."""
+
+    def __init__(self, options) -> None:
+        super().__init__(options)
+        self.interrupted = asyncio.Event()
+
+    async def interrupt(self) -> None:
+        self.interrupted.set()
+
+    async def receive_response(self):
+        yield AssistantMessage(content=[TextBlock(text="Working on it")], model="m")
+        await self.interrupted.wait()
+        yield AssistantMessage(content=[TextBlock(text="late output")], model="m")
+        yield ResultMessage(
+            subtype="error_during_execution",
+            duration_ms=1,
+            duration_api_ms=1,
+            is_error=True,
+            num_turns=1,
+            session_id="s",
+        )
+
+
+class HangingClient(ScriptedClient):
+    """Client whose disconnect never finishes on its own."""
+
+    def __init__(self, options) -> None:
+        super().__init__(options)
+        self.disconnect_cancelled = False
+
+    async def disconnect(self) -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.disconnect_cancelled = True
+            raise
+
+
+@pytest.fixture
+def scripted_app(monkeypatch) -> CameronCodeApp:
+    """CameronCodeApp wired to a ScriptedClient instead of the real SDK."""
+    monkeypatch.setattr(tui, "ClaudeSDKClient", ScriptedClient)
+    return CameronCodeApp()
+
+
+class TestChatContainer:
+    """Tests for chat message mounting and scrolling."""
+
+    async def test_scroll_requests_coalesce(self) -> None:
+        """Verify a burst of messages schedules a single scroll to the end."""
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatContainer)
+            scrolls: list[bool] = []
+            chat.scroll_end = lambda **kwargs: scrolls.append(True)
+
+            for i in range(5):
+                chat.add_message("user", f"message {i}")
+            assert chat._scroll_pending
+
+            chat._scroll_to_end()
+            chat.add_message("user", "after the scroll")
+            assert scrolls == [True]
+            assert chat._scroll_pending
+            await pilot.pause()
+            assert len(chat.query(MessageDisplay)) == 6
+
+    async def test_history_is_capped(self) -> None:
+        """Verify messages past the history limit are dropped, oldest first."""
+        app = ChatApp(max_messages=3)
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatContainer)
+            for i in range(5):
+                chat.add_message("user", f"message {i}")
+            await pilot.pause()
+
+            assert [m.content for m in chat.query(MessageDisplay)] == [
+                "message 2",
+                "message 3",
+                "message 4",
+            ]
+
+    async def test_old_messages_unmount_and_return_on_scroll_up(self) -> None:
+        """Verify only the newest messages stay mounted until the user scrolls back."""
+        app = ChatApp(mounted_messages=5)
+        async with app.run_test(size=(80, 10)) as pilot:
+            chat = app.query_one(ChatContainer)
+            for i in range(30):
+                chat.add_message("user", f"message {i}")
+            while chat.scroll_y == 0:
+                await pilot.pause(0.01)
+
+            assert len(chat.query(MessageDisplay)) == 5
+            assert chat.query(MessageDisplay).first().content == "message 25"
+
+            chat.scroll_to(y=0, animate=False)
+            await pilot.pause()
+            assert len(chat.query(MessageDisplay)) == 25
+            assert chat.query(MessageDisplay).first().content == "message 5"
+
+
+class TestMessageContent:
+    """Tests for choosing how message bodies are rendered."""
+
+    def test_plain_text_skips_markdown(self) -> None:
+        """Verify markup-free one-liners render as a plain Static."""
+        widget = _content_widget("Still connecting to Claude, try again in a moment.")
+        assert type(widget) is Static
+
+    async def test_plain_message_is_a_single_widget(self) -> None:
+        """Verify plain messages draw header and body without child widgets."""
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatContainer)
+            chat.add_message("system", "Chat cleared.")
+            chat.add_message("tool", "**Read**")
+            await pilot.pause()
+
+            plain, markdown = chat.query(MessageDisplay)
+            assert not plain.children
+            assert len(markdown.children) == 2
+
+    def test_markdown_flag_overrides_detection(self) -> None:
+        """Verify verbatim messages stay single widgets despite Markdown characters."""
+        assert MessageDisplay("tool", "mcp__cameron__cameron_search", markdown=False)._single_widget
+        assert not MessageDisplay("system", "plain", markdown=True)._single_widget
+
+    def test_markdown_parse_is_shared_and_memoized(self) -> None:
+        """Verify Markdown widgets share one parser that reuses token streams."""
+        assert _markdown_parser() is _markdown_parser()
+
+        parser = _markdown_parser()
+        source = "# Heading\n\nSome **bold** text and `code`."
+        first = parser.parse(source)
+        hits = parser._parse_cached.cache_info().hits
+        assert parser.parse(source) == first
+        assert parser._parse_cached.cache_info().hits == hits + 1
+
+    def test_welcome_is_prerendered(self) -> None:
+        """Verify the fixed welcome text skips the Markdown widget."""
+        widget = _content_widget(tui.WELCOME_TEXT)
+        assert type(widget) is Static
+        assert widget.content is tui._PRERENDERED[tui.WELCOME_TEXT]
+
+    def test_markdown_syntax_uses_markdown(self) -> None:
+        """Verify anything that could be Markdown gets the Markdown widget."""
+        for content in ("**Read**", "_thinking_", "1. first", "line one\nline two", "[link](x)"):
+            assert isinstance(_content_widget(content), Markdown), content
+
+
+class TestThinkingIndicator:
+    """Tests for thinking verb rotation."""
+
+    def test_tool_verbs_wrap_around(self) -> None:
+        """Verify rotation cycles through the tool's verbs and starts over."""
+        indicator = ThinkingIndicator("Read")
+        seen = [indicator._verb]
+        for _ in TOOL_VERBS["Read"]:
+            indicator._rotate_verb()
+            seen.append(indicator._verb)
+
+        assert seen == ["Reading (Read)", "Scanning (Read)", "Loading (Read)", "Reading (Read)"]
+
+    def test_bumps_are_throttled(self, monkeypatch) -> None:
+        """Verify a burst of output advances the verb once per minimum interval."""
+        clock = [100.0]
+        monkeypatch.setattr(tui.time, "monotonic", lambda: clock[0])
+        indicator = ThinkingIndicator("Read")
+        indicator.start("Read")
+
+        indicator.bump()
+        assert indicator._verb == "Reading (Read)"
+
+        clock[0] += tui.VERB_MIN_INTERVAL
+        for _ in range(5):
+            indicator.bump()
+        assert indicator._verb == "Scanning (Read)"
+
+        indicator.stop()
+        clock[0] += tui.VERB_MIN_INTERVAL
+        indicator.bump()
+        assert indicator._verb == "Scanning (Read)"
+
+
+class TestStreaming:
+    """Tests for streaming assistant replies into the chat."""
+
+    async def test_text_streams_into_one_message(self, scripted_app: CameronCodeApp) -> None:
+        """Verify consecutive text blocks share one bubble, split by tool use."""
+        async with scripted_app.run_test() as pilot:
+            while scripted_app.client is None:
+                await pilot.pause()
+            scripted_app.client.messages = [
+                AssistantMessage(content=[TextBlock(text="Hello ")], model="m"),
+                AssistantMessage(content=[TextBlock(text="**world**")], model="m"),
+                AssistantMessage(content=[ToolUseBlock(id="t1", name="Read", input={})], model="m"),
+                AssistantMessage(content=[TextBlock(text="Done.")], model="m"),
+                ResultMessage(
+                    subtype="success",
+                    duration_ms=1,
+                    duration_api_ms=1,
+                    is_error=False,
+                    num_turns=1,
+                    session_id="s",
+                ),
+            ]
+            await scripted_app._process_query("hi")
+            await pilot.pause()
+
+            messages = [(m.role, m.content) for m in scripted_app.query(MessageDisplay)]
+            assert messages[-3:] == [
+                ("assistant", "Hello **world**"),
+                ("tool", "Read"),
+                ("assistant", "Done."),
+            ]
+            assert not any(m.streaming for m in scripted_app.query(MessageDisplay))
+
+    async def test_flushes_continue_the_live_line(self, scripted_app: CameronCodeApp) -> None:
+        """Verify chunks flushed separately read as one line while still streaming."""
+        async with scripted_app.run_test(size=(80, 24)) as pilot:
+            for chunk in ("Hello wor", "ld, how are", " you"):
+                await scripted_app._append_stream(chunk)
+                scripted_app._flush_stream()
+                await pilot.pause()
+
+            log = scripted_app._stream_log
+            lines = [strip.text.strip() for strip in log.render_lines(Region(0, 0, *log.size))]
+            assert [line for line in lines if line] == ["Hello world, how are you"]
+
+    async def test_clear_during_stream(self, monkeypatch) -> None:
+        """Verify Ctrl+L mid-reply drops the stream and later text starts a new message."""
+        monkeypatch.setattr(tui, "ClaudeSDKClient", InterruptibleClient)
+        app = CameronCodeApp()
+        async with app.run_test() as pilot:
+            while app.client is None:
+                await pilot.pause()
+            app._input.value = "hi"
+            await pilot.press("enter")
+            while app._stream_display is None:
+                await pilot.pause()
+
+            await pilot.press("ctrl+l")
+            assert app._stream_display is None
+            # Release the stalled reply without cancelling it
+            app.client.interrupted.set()
+            while app.is_processing:
+                await pilot.pause()
+
+            replies = [m.content for m in app.query(MessageDisplay) if m.role == "assistant"]
+            assert replies == ["late output"]
+            assert not any(m.streaming for m in app.query(MessageDisplay))
+
+
+class TestBatching:
+    """Tests for grouping SDK messages that arrive together."""
+
+    async def test_ready_items_share_a_batch(self) -> None:
+        """Verify items queued while the consumer is busy come through together."""
+
+        release = asyncio.Event()
+
+        async def source():
+            for i in range(5):
+                yield i
+            await release.wait()
+            yield 5
+
+        batches = []
+        async for batch in _batched(source(), max_batch=3):
+            batches.append(batch)
+            if len(batches) == 2:
+                release.set()
+
+        assert batches == [[0, 1, 2], [3, 4], [5]]
+
+    async def test_source_errors_follow_delivered_items(self) -> None:
+        """Verify a failing source still hands over what it produced first."""
+
+        async def source():
+            yield "partial"
+            raise RuntimeError("stream closed")
+
+        received = []
+        with pytest.raises(RuntimeError, match="stream closed"):
+            async for batch in _batched(source(), max_batch=8):
+                received.extend(batch)
+
+        assert received == ["partial"]
+
+    async def test_closing_waits_for_the_pump(self) -> None:
+        """Verify closing the batches stops reading ``source`` before it returns."""
+        closed: list[bool] = []
+
+        async def source():
+            try:
+                yield "first"
+                await asyncio.Event().wait()
+            finally:
+                closed.append(True)
+
+        async with contextlib.aclosing(_batched(source(), max_batch=8)) as batches:
+            async for _ in batches:
+                break
+
+        assert closed == [True]
+
+
+class TestCancel:
+    """Tests for interrupting a running query."""
+
+    async def test_escape_interrupts_running_query(self, monkeypatch) -> None:
+        """Verify Escape is handled mid-reply and later output is dropped."""
+        monkeypatch.setattr(tui, "ClaudeSDKClient", InterruptibleClient)
+        app = CameronCodeApp()
+        async with app.run_test() as pilot:
+            while app.client is None:
+                await pilot.pause()
+            app._input.value = "hi"
+            await pilot.press("enter")
+            while app._stream_display is None:
+                await pilot.pause()
+
+            await pilot.press("escape")
+            while app.is_processing:
+                await pilot.pause()
+
+            assert app.client.interrupted.is_set()
+            replies = [m.content for m in app.query(MessageDisplay) if m.role == "assistant"]
+            assert replies == ["Working on it"]
+            assert app._last_status == "Cancelled"
+
+
+class TestShutdown:
+    """Tests for leaving the app while the client is still connected."""
+
+    async def test_slow_disconnect_is_cancelled(self, monkeypatch) -> None:
+        """Verify a disconnect past the timeout is cancelled, not left pending."""
+        monkeypatch.setattr(tui, "ClaudeSDKClient", HangingClient)
+        monkeypatch.setattr(tui, "DISCONNECT_TIMEOUT", 0.01)
+        app = CameronCodeApp()
+        async with app.run_test() as pilot:
+            while app.client is None:
+                await pilot.pause()
+            client = app.client
+
+        assert client.disconnect_cancelled
+        assert app._disconnect_task.done()
+
+
+class TestSlashCommandSuggester:
+    """Tests for slash command autocompletion."""
+
+    async def test_suggests_first_prefix_match(self) -> None:
+        """Verify the alphabetically first longer command is suggested."""
+        suggester = SlashCommandSuggester(
+            [{"name": name} for name in ("review", "review-pr", "compact", "clear")]
+        )
+
+        assert await suggester.get_suggestion("/c") == "/clear"
+        assert await suggester.get_suggestion("/review") == "/review-pr"
+        assert await suggester.get_suggestion("/review-pr") is None
+        assert await suggester.get_suggestion("review") is None
+
+
+class TestHookPreview:
+    """Tests for hook message previews."""
+
+    def test_short_values_shown_whole(self) -> None:
+        """Verify small inputs read like str() of the value."""
+        assert _hook_preview({"command": "ls -la"}) == "{'command': 'ls -la'}"
+        assert _hook_preview("done") == "done"
+
+    def test_large_values_truncated_in_key_order(self) -> None:
+        """Verify big inputs are cut to the preview length, keeping key order."""
+        preview = _hook_preview({"file_path": "notes.md", "content": "x" * 100_000})
+
+        assert preview.startswith("{'file_path': 'notes.md', 'content': 'xxx")
+        assert preview.endswith("...")
+        assert len(preview) == 103
+
+
+class TestCommandPalette:
+    """Tests for the slash command palette."""
+
+    async def test_toggle_reuses_widgets(self, scripted_app: CameronCodeApp) -> None:
+        """Verify toggling shows and hides the same populated option list."""
+        async with scripted_app.run_test() as pilot:
+            while not scripted_app.available_commands:
+                await pilot.pause()
+            palette = scripted_app.query_one("#command-palette")
+            option_list = palette.query_one(OptionList)
+
+            for _ in range(3):
+                await scripted_app.run_action("toggle_palette")
+            await pilot.pause()
+
+            assert palette.has_class("visible")
+            assert palette.query_one(OptionList) is option_list
+            assert option_list.get_option_at_index(0).id == "/greet"
+
+    async def test_selecting_fills_input(self, scripted_app: CameronCodeApp) -> None:
+        """Verify choosing a command puts it in the prompt and hides the palette."""
+        async with scripted_app.run_test() as pilot:
+            while not scripted_app.available_commands:
+                await pilot.pause()
+            await scripted_app.run_action("toggle_palette")
+            option_list = scripted_app.query_one("#command-list", OptionList)
+            option_list.focus()
+            option_list.highlighted = 0
+            await pilot.press("enter")
+
+            assert scripted_app.query_one("#prompt-input").value == "/greet "
+            assert not scripted_app.query_one("#command-palette").has_class("visible")
+
+    async def test_duplicate_names_listed_once(self, scripted_app: CameronCodeApp) -> None:
+        """Verify repeated command names don't collide on option ids."""
+        async with scripted_app.run_test() as pilot:
+            while not scripted_app.available_commands:
+                await pilot.pause()
+            palette = scripted_app.query_one("#command-palette")
+            palette.populate(
+                [{"name": "greet", "description": "Project"}, {"name": "greet"}, {"name": "help"}]
+            )
+
+            option_list = palette.query_one(OptionList)
+            ids = [option_list.get_option_at_index(i).id for i in range(option_list.option_count)]
+            assert ids == ["/greet", "/help"]
+
+
+class TestModelSwitch:
+    """Tests for cycling the active model."""
+
+    async def test_switch_cycles_and_wraps(self, scripted_app: CameronCodeApp) -> None:
+        """Verify each switch moves to the next model and wraps back to the first."""
+        async with scripted_app.run_test() as pilot:
+            while scripted_app.client is None:
+                await pilot.pause()
+            seen = []
+            for _ in range(3):
+                await scripted_app.action_switch_model()
+                seen.append(scripted_app.current_model)
+
+            assert seen == ["opus", "haiku", "sonnet"]
+
+
+class TestToolTimings:
+    """Tests for tool duration bookkeeping."""
+
+    async def test_unfinished_calls_are_bounded(
+        self, scripted_app: CameronCodeApp, monkeypatch
+    ) -> None:
+        """Verify start times for calls that never finish don't grow without limit."""
+        monkeypatch.setattr(tui, "MAX_TOOL_TIMINGS", 3)
+        async with scripted_app.run_test():
+            scripted_app.show_hooks = True
+            for i in range(5):
+                await scripted_app._pre_tool_hook({"tool_name": "Bash"}, f"tool-{i}", None)
+
+            assert list(scripted_app.tool_timings) == ["tool-2", "tool-3", "tool-4"]
+
+    async def test_result_drops_unfinished_calls(self, scripted_app: CameronCodeApp) -> None:
+        """Verify start times left over when a turn ends are discarded."""
+        async with scripted_app.run_test() as pilot:
+            while scripted_app.client is None:
+                await pilot.pause()
+            scripted_app.show_hooks = True
+            await scripted_app._pre_tool_hook({"tool_name": "Bash"}, "tool-1", None)
+            scripted_app.client.messages = [
+                ResultMessage(
+                    subtype="error_during_execution",
+                    duration_ms=1,
+                    duration_api_ms=1,
+                    is_error=True,
+                    num_turns=1,
+                    session_id="s",
+                ),
+            ]
+            await scripted_app._process_query("hi")
+
+            assert scripted_app.tool_timings == {}
+
+    async def test_hidden_hooks_skip_timing(self, scripted_app: CameronCodeApp) -> None:
+        """Verify no start times are kept while hook messages are hidden."""
+        async with scripted_app.run_test():
+            await scripted_app._pre_tool_hook({"tool_name": "Bash"}, "tool-1", None)
+
+            assert scripted_app.tool_timings == {}
+
+    async def test_hook_messages_skip_markdown(self, scripted_app: CameronCodeApp) -> None:
+        """Verify hook output is shown verbatim as single-widget messages."""
+        async with scripted_app.run_test() as pilot:
+            scripted_app.show_hooks = True
+            await scripted_app._pre_tool_hook(
+                {"tool_name": "Bash", "tool_input": {"command": "echo **hi**"}}, "tool-1", None
+            )
+            await pilot.pause()
+
+            message = scripted_app.query(MessageDisplay).last()
+            assert message.content == "PreToolUse: Bash\n{'command': 'echo **hi**'}"
+            assert not message.children
+
+    async def test_parallel_burst_folds_keeping_every_preview(
+        self, scripted_app: CameronCodeApp
+    ) -> None:
+        """Verify a burst of same-tool hooks folds into one message per event, previews kept."""
+        async with scripted_app.run_test() as pilot:
+            scripted_app.show_hooks = True
+            for i in range(3):
+                await scripted_app._handle_tool_block(
+                    ToolUseBlock(id=f"t{i}", name="Read", input={"file_path": f"f{i}"})
+                )
+            # Parallel calls: every PreToolUse fires before the first PostToolUse
+            for i in range(3):
+                await scripted_app._pre_tool_hook(
+                    {"tool_name": "Read", "tool_input": {"file_path": f"f{i}"}}, f"t{i}", None
+                )
+            for i in range(3):
+                await scripted_app._post_tool_hook(
+                    {"tool_name": "Read", "tool_response": f"r{i}"}, f"t{i}", None
+                )
+            await pilot.pause()
+
+            pre, post = [m.content for m in scripted_app.query(MessageDisplay) if m.role == "hook"]
+            assert pre == (
+                "PreToolUse: Read (×3)\n"
+                "{'file_path': 'f0'}\n{'file_path': 'f1'}\n{'file_path': 'f2'}"
+            )
+            assert post.startswith("PostToolUse: Read") and "(×3)" in post.partition("\n")[0]
+            assert all(f"r{i}" in post for i in range(3))
+
+    async def test_sequential_calls_stay_separate(self, scripted_app: CameronCodeApp) -> None:
+        """Verify one-at-a-time calls, split by their tool-use messages, don't fold."""
+        async with scripted_app.run_test() as pilot:
+            scripted_app.show_hooks = True
+            for i in range(2):
+                block = ToolUseBlock(id=f"t{i}", name="Read", input={})
+                await scripted_app._handle_tool_block(block)
+                await scripted_app._pre_tool_hook({"tool_name": "Read"}, f"t{i}", None)
+                await scripted_app._post_tool_hook({"tool_name": "Read"}, f"t{i}", None)
+            await pilot.pause()
+
+            hooks = [m.content for m in scripted_app.query(MessageDisplay) if m.role == "hook"]
+            assert len(hooks) == 4
+            assert not any("(×" in hook for hook in hooks)